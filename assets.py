@@ -26,60 +26,99 @@ def get_background():
 
 
 
-def _scale(surf: pygame.Surface) -> pygame.Surface:
-    if SCALE == 1:
-        return surf
-    return pygame.transform.rotozoom(surf, 0, SCALE)
-
-def get_hero_frames():
-    hero_dir = _ASSET_ROOT / "Hero"
-    stand = _scale(load_image(hero_dir / "Hero_stand.png"))
-    run = [
-        stand,
-        _scale(load_image(hero_dir / "Hero_run_1.png")),
-        _scale(load_image(hero_dir / "Hero_run_2.png")),
-        _scale(load_image(hero_dir / "Hero_run_3.png")),
-        _scale(load_image(hero_dir / "Hero_run_4.png")),
-    ]
-    jump = [
-        _scale(load_image(hero_dir / "Hero_jump_1.png")),
-        _scale(load_image(hero_dir / "Hero_jump_2.png")),
-        _scale(load_image(hero_dir / "Hero_jump_3.png")),
-    ]
-    throw = [
-        _scale(load_image(hero_dir / "Hero_throw_1.png")),
-        _scale(load_image(hero_dir / "Hero_throw_2.png")),
-    ]
-    fall = [
-        _scale(load_image(hero_dir / "Hero_fall_1.png")),
-        _scale(load_image(hero_dir / "Hero_fall_2.png")),
-        _scale(load_image(hero_dir / "Hero_fall_3.png")),
-    ]
+# Scaled, flipped and rotated variants, keyed by (path, transform chain).
+_derived_cache = {}
+_derived_stats = {"hits": 0, "misses": 0}
+
+_TRANSFORMS = {
+    "scale": lambda surf, factor: surf if factor == 1 else pygame.transform.rotozoom(surf, 0, factor),
+    "rotozoom": lambda surf, angle, factor: pygame.transform.rotozoom(surf, angle, factor),
+    "rotate": lambda surf, angle: pygame.transform.rotate(surf, angle),
+    "flip": lambda surf, flip_x, flip_y: pygame.transform.flip(surf, flip_x, flip_y),
+}
+
+_SCALED = ("scale", SCALE)
+
+
+def _derive(key: str, chain: tuple) -> pygame.Surface:
+    surf = _derived_cache.get((key, chain))
+    if surf is None:
+        source = _derive(key, chain[:-1]) if chain else load_image(Path(key))
+        if chain:
+            name, *args = chain[-1]
+            surf = _TRANSFORMS[name](source, *args)
+        else:
+            surf = source
+        _derived_cache[(key, chain)] = surf
+    return surf
+
+def derived_image(path: Path, *chain: tuple) -> pygame.Surface:
+    """Return the image at ``path`` after each ``(name, *args)`` step of ``chain``.
+
+    Steps are ``("scale", factor)``, ``("rotozoom", angle, factor)``,
+    ``("rotate", angle)`` and ``("flip", flip_x, flip_y)``. Each variant (and
+    each prefix of its chain) is built once per process; callers share the
+    result and must not draw onto it.
+    """
+    key = str(path)
+    if (key, chain) in _derived_cache:
+        _derived_stats["hits"] += 1
+        return _derived_cache[(key, chain)]
+    _derived_stats["misses"] += 1
+    return _derive(key, chain)
+
+def derived_cache_stats() -> dict:
+    """Hit and miss counts of ``derived_image`` lookups, plus the cached variant count."""
+    return {**_derived_stats, "entries": len(_derived_cache)}
+
+def _scaled(name: str, *chain: tuple) -> pygame.Surface:
+    return derived_image(_ASSET_ROOT / name, _SCALED, *chain)
+
+def get_hero_frames(flipped: bool = False):
+    """Return the hero's stand frame and run/jump/throw/fall lists; ``flipped`` faces left."""
+    mirror = (("flip", True, False),) if flipped else ()
+    stand = _scaled("Hero/Hero_stand.png", *mirror)
+    run = [stand] + [_scaled(f"Hero/Hero_run_{i}.png", *mirror) for i in (1, 2, 3, 4)]
+    jump = [_scaled(f"Hero/Hero_jump_{i}.png", *mirror) for i in (1, 2, 3)]
+    throw = [_scaled(f"Hero/Hero_throw_{i}.png", *mirror) for i in (1, 2)]
+    fall = [_scaled(f"Hero/Hero_fall_{i}.png", *mirror) for i in (1, 2, 3)]
     return stand, run, jump, throw, fall
 
-def get_target():
-    surf = load_image(_ASSET_ROOT / "Target.png")
-    return _scale(surf)
+def get_target(flipped: bool = False):
+    return _scaled("Target.png", ("flip", True, False)) if flipped else _scaled("Target.png")
 
 def get_heart():
-    surf = load_image(_ASSET_ROOT / "Heart.png")
-    return _scale(surf)
+    return _scaled("Heart.png")
 
 def get_heart_half():
-    surf = load_image(_ASSET_ROOT / "Heart_2.png")
-    return _scale(surf)
+    return _scaled("Heart_2.png")
 
 def get_banana_image():
-    return _scale(load_image(_ASSET_ROOT / "Banana.png"))
+    return _scaled("Banana.png")
+
+def get_banana_frames() -> tuple[pygame.Surface, ...]:
+    """The banana image and its 90, 180 and 270 degree rotations."""
+    return tuple(
+        _scaled("Banana.png", ("rotate", angle)) if angle else _scaled("Banana.png")
+        for angle in (0, 90, 180, 270)
+    )
 
-def get_banana_splashed():
-    return _scale(load_image(_ASSET_ROOT / "Banana_squashed.png"))
+def get_banana_splashed(rotated: bool = False):
+    """The splat image; ``rotated`` gives the quarter-turned one left after a step-on."""
+    return _scaled("Banana_squashed.png", ("rotate", 90)) if rotated else _scaled("Banana_squashed.png")
 
-def get_hook_image() -> pygame.Surface:
-    return _scale(load_image(_ASSET_ROOT / "Hook.png"))
+def get_hook_image(flipped: bool = False) -> pygame.Surface:
+    return _scaled("Hook.png", ("flip", True, False)) if flipped else _scaled("Hook.png")
 
 def get_stars_image() -> pygame.Surface:
-    return _scale(load_image(_ASSET_ROOT / "Stars.png"))
+    return _scaled("Stars.png")
+
+def get_stars_frames() -> tuple[pygame.Surface, ...]:
+    """The hit-stars image and its 90, 180 and 270 degree rotations."""
+    return tuple(
+        _scaled("Stars.png", ("rotate", angle)) if angle else _scaled("Stars.png")
+        for angle in (0, 90, 180, 270)
+    )
 
 def get_floor_images() -> list[pygame.Surface]:
     """Return Floor_1..4 surfaces, scaled overall and then enlarged by 1.5x."""
@@ -88,7 +127,5 @@ def get_floor_images() -> list[pygame.Surface]:
     for i in (1, 2, 3, 4):
         p = floor_dir / f"Floor_{i}.png"
         if p.exists():
-            base = _scale(load_image(p))
-            bigger = pygame.transform.rotozoom(base, 0, 1.5)  # +50%
-            floors.append(bigger)
+            floors.append(derived_image(p, _SCALED, ("rotozoom", 0, 1.5)))  # +50%
     return floors
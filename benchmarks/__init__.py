@@ -0,0 +1 @@
+"""Performance benchmarks for SlingDuel's simulation hot paths (run with ``python -m``)."""
@@ -0,0 +1,132 @@
+"""Performance regression gate for the scenario benchmarks.
+
+Usage::
+
+    python -m benchmarks.gate                      # compare against benchmarks/baseline.json
+    python -m benchmarks.gate --tolerance 0.15     # allow at most 15% slowdown
+    python -m benchmarks.gate --update-baseline    # accept the current numbers
+
+Runs ``benchmarks.suite`` (best of ``--runs`` passes to damp noise), prints a
+per-scenario diff table against the committed baseline, and exits non-zero
+when any latency grows, or ticks per second drops, by more than the tolerance.
+Baselines are machine specific: regenerate them on the machine that runs the gate.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+from .suite import add_suite_arguments, run_suite
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+GATED_STATS = ("p50_us", "mean_us", "p95_us", "p99_us")
+
+
+def merge_best(reports: list[dict], stat: str) -> dict:
+    """Combine several suite runs, keeping the fastest figures for each metric."""
+    merged = reports[0]
+    for report in reports[1:]:
+        for name, result in report["results"].items():
+            best = merged["results"][name]
+            if "ticks_per_second" in result:
+                best["ticks_per_second"] = max(best["ticks_per_second"], result["ticks_per_second"])
+            for metric, stats in result["metrics"].items():
+                if stats[stat] < best["metrics"][metric][stat]:
+                    best["metrics"][metric] = stats
+    return merged
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    *,
+    stat: str,
+    tolerance: float,
+    min_delta_us: float,
+) -> tuple[list[tuple[str, str, float, float, float, bool]], bool]:
+    """Return ``(rows, failed)`` with one ``(scenario, metric, base, now, change, regressed)`` row per figure.
+
+    ``change`` is the relative slowdown (positive is worse). Latency deltas
+    smaller than ``min_delta_us`` never count as regressions. Figures the
+    baseline lacks are listed with a NaN ``base`` so they cannot go unnoticed.
+    """
+    rows = []
+    failed = False
+    for name, result in current["results"].items():
+        base_result = baseline["results"].get(name, {"metrics": {}})
+        if "ticks_per_second" in result and base_result.get("ticks_per_second"):
+            base_rate, rate = base_result["ticks_per_second"], result["ticks_per_second"]
+            change = base_rate / rate - 1.0 if rate > 0 else float("inf")
+            regressed = change > tolerance
+            rows.append((name, "ticks/s", base_rate, rate, change, regressed))
+            failed |= regressed
+        for metric, stats in result["metrics"].items():
+            base_stats = base_result["metrics"].get(metric)
+            if base_stats is None:
+                rows.append((name, f"{metric} {stat}", math.nan, stats[stat], 0.0, False))
+                continue
+            base_value, value = base_stats[stat], stats[stat]
+            change = value / base_value - 1.0 if base_value > 0 else 0.0
+            regressed = change > tolerance and value - base_value > min_delta_us
+            rows.append((name, f"{metric} {stat}", base_value, value, change, regressed))
+            failed |= regressed
+    return rows, failed
+
+
+def print_table(rows: list[tuple[str, str, float, float, float, bool]], tolerance: float) -> None:
+    print(f"{'scenario':<12} {'metric':<28} {'baseline':>11} {'current':>11} {'change':>8}")
+    for name, label, base_value, value, change, regressed in rows:
+        if math.isnan(base_value):
+            status = "no baseline"
+        else:
+            status = "REGRESSED" if regressed else ("faster" if change < -tolerance else "ok")
+        print(f"{name:<12} {label:<28} {base_value:11.1f} {value:11.1f} {change:+8.1%}  {status}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Fail when benchmarks regress against a stored baseline.")
+    add_suite_arguments(parser)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (0.25 = 25%%)")
+    parser.add_argument("--stat", choices=GATED_STATS, default="p50_us", help="latency statistic to compare")
+    parser.add_argument("--min-delta-us", type=float, default=5.0, help="ignore latency changes below this")
+    parser.add_argument("--runs", type=int, default=3, help="suite passes; the fastest figures are kept")
+    parser.add_argument("--update-baseline", action="store_true", help="write the current results as the baseline")
+    args = parser.parse_args(argv)
+
+    reports = [
+        run_suite(args.ticks, names=args.scenario, render=not args.no_render)
+        for _ in range(max(1, args.runs))
+    ]
+    current = merge_best(reports, args.stat)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline first", file=sys.stderr)
+        return 2
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    rows, failed = compare(
+        baseline,
+        current,
+        stat=args.stat,
+        tolerance=args.tolerance,
+        min_delta_us=args.min_delta_us,
+    )
+    print_table(rows, args.tolerance)
+    if failed:
+        print(f"\nFAIL: performance regressed by more than {args.tolerance:.0%}")
+        return 1
+    print(f"\nOK: no regression beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
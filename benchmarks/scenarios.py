@@ -0,0 +1,164 @@
+"""Scripted, reproducible worlds used by the benchmark suite.
+
+Each scenario builds a world in a representative steady state and supplies
+the per-tick input script that keeps it there. Runners snapshot the built
+world and restore it every ``window`` ticks, so long measurements never
+drift into a different workload (bananas landing, rounds ending).
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+from assets import get_floor_images
+from constants import GROUND_Y, HOOK_THROW_BASE_SPEED, SCREEN_WIDTH
+from game.headless import init_headless_display
+from game.world import GameWorld
+from inputframe import IDLE_FRAME, InputFrame
+from keymap import ACTION_BITS
+from sprites.banana import Banana, BananaPickup
+from sprites.platform import Platform
+from sprites.sling import Sling
+
+_UP = ACTION_BITS["up"]
+_SLING = ACTION_BITS["sling"]
+
+SCENARIO_SEED = 1234
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """A named world builder plus the inputs to feed it on every tick."""
+
+    name: str
+    description: str
+    build: Callable[[], GameWorld]
+    inputs: Callable[[int], InputFrame] = lambda tick: IDLE_FRAME
+    window: int = 60  # ticks between restores of the built state
+
+
+def new_world(*, test_mode: bool = False, seed: int = SCENARIO_SEED, vectorized: bool = False) -> GameWorld:
+    init_headless_display()
+    world = GameWorld(test_mode=test_mode, vectorized_projectiles=vectorized)
+    world.begin_round(seed=seed)
+    return world
+
+
+def add_flying_bananas(world: GameWorld, count: int, *, seed: int = SCENARIO_SEED) -> None:
+    """Launch ``count`` bananas upward across the arena, alternating owners."""
+    rng = random.Random(seed)
+    players = world.players.as_tuple()
+    for idx in range(count):
+        x_pos = rng.randint(40, SCREEN_WIDTH - 40)
+        y_pos = rng.randint(GROUND_Y - 260, GROUND_Y - 120)
+        velocity = (rng.uniform(-4.0, 4.0), rng.uniform(-14.0, -9.0))
+        world.throwables.add(Banana((x_pos, y_pos), velocity, owner=players[idx % 2]))
+
+
+def add_splats(world: GameWorld, count: int, *, seed: int = SCENARIO_SEED) -> None:
+    """Leave ``count`` persistent splats spread over the platform tops.
+
+    Ground splats are capped at two by the world, so platforms carry the load.
+    """
+    rng = random.Random(seed)
+    platforms = world.platforms.sprites()
+    owner = world.players.first
+    for _ in range(count):
+        surface = rng.choice(platforms).stand_rect
+        banana = Banana((rng.randint(surface.left, surface.right), surface.top), (0, 0), owner=owner)
+        banana._to_splat()
+        banana.rect.bottom = surface.top
+        banana.state = "splatted_persist"
+        banana._notified_result = True
+        world.throwables.add(banana)
+        world.splats.add(banana)
+
+
+def add_platforms(world: GameWorld, count: int, *, seed: int = SCENARIO_SEED) -> None:
+    """Add ``count`` platforms at random spots above the ground (overlaps allowed)."""
+    rng = random.Random(seed)
+    floor_imgs = get_floor_images()
+    for _ in range(count):
+        variant = rng.randrange(len(floor_imgs))
+        midtop = (rng.randint(60, SCREEN_WIDTH - 60), rng.randint(80, GROUND_Y - 140))
+        world.platforms.add(Platform(floor_imgs[variant], midtop=midtop, variant=variant))
+
+
+def add_banana_pickups(world: GameWorld, count: int, *, seed: int = SCENARIO_SEED) -> None:
+    """Scatter ``count`` banana pickups over the platform tops and the ground."""
+    rng = random.Random(seed)
+    surfaces = [platform.stand_rect for platform in world.platforms.sprites()]
+    for _ in range(count):
+        if surfaces and rng.random() < 0.8:
+            surface = rng.choice(surfaces)
+            world.banana_pickups.add(BananaPickup(rng.randint(surface.left, surface.right), surface.top))
+        else:
+            world.banana_pickups.add(BananaPickup(rng.randint(40, SCREEN_WIDTH - 40), GROUND_Y))
+
+
+def add_hooks(world: GameWorld, count: int, *, seed: int = SCENARIO_SEED) -> None:
+    """Throw ``count`` hooks upward from random points, alternating owners."""
+    rng = random.Random(seed)
+    players = world.players.as_tuple()
+    for idx in range(count):
+        start = (rng.randint(40, SCREEN_WIDTH - 40), rng.randint(GROUND_Y - 200, GROUND_Y - 60))
+        velocity = (rng.uniform(-0.5, 0.5) * HOOK_THROW_BASE_SPEED, -HOOK_THROW_BASE_SPEED)
+        world.hooks.add(Sling(start, velocity, owner=players[idx % 2]))
+
+
+def _build_idle() -> GameWorld:
+    return new_world()
+
+
+def _swing_inputs(tick: int) -> InputFrame:
+    return InputFrame(_SLING, _SLING)
+
+
+def _build_swinging() -> GameWorld:
+    world = new_world()
+    for _ in range(25):
+        world.update(InputFrame(_UP, _UP))
+    # Keep the hook button held until both heroes hang from their ropes.
+    for _ in range(240):
+        world.update(_swing_inputs(0))
+        hooks = [hero.hook_sprite for hero in world.players]
+        if all(hook is not None and hook.state == "attached" for hook in hooks):
+            break
+    return world
+
+
+def _build_bananas() -> GameWorld:
+    world = new_world()
+    add_flying_bananas(world, 50)
+    return world
+
+
+def _build_splats() -> GameWorld:
+    world = new_world()
+    add_splats(world, 200)
+    return world
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("idle", "fresh round, nobody pressing keys", _build_idle),
+        Scenario("swinging", "both heroes hanging from attached hooks", _build_swinging, _swing_inputs),
+        Scenario("bananas_50", "50 bananas in flight", _build_bananas, window=30),
+        Scenario("splats_200", "200 persistent splats on platforms", _build_splats),
+    )
+}
+
+
+__all__ = [
+    "SCENARIOS",
+    "SCENARIO_SEED",
+    "Scenario",
+    "add_banana_pickups",
+    "add_flying_bananas",
+    "add_hooks",
+    "add_platforms",
+    "add_splats",
+    "new_world",
+]
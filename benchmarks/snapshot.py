@@ -0,0 +1,80 @@
+"""Microbenchmark for GameWorld.snapshot()/restore().
+
+Usage::
+
+    python -m benchmarks.snapshot --budget-us 50
+
+Builds a busy mid-round world (bananas in flight, a hook attached, splats on
+the floor), then times both calls and exits non-zero when either median
+exceeds the budget.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+from game.headless import init_headless_display
+from game.world import GameWorld
+from inputframe import InputFrame
+from keymap import ACTION_BITS
+
+_THROW = ACTION_BITS["throw"]
+_SLING = ACTION_BITS["sling"]
+_UP = ACTION_BITS["up"]
+
+
+def build_busy_world(seed: int = 1234) -> GameWorld:
+    """Return a test-mode world mid-round with projectiles, splats and an attached hook."""
+    init_headless_display()
+    world = GameWorld(test_mode=True)
+    world.begin_round(seed=seed)
+    for tick in range(240):
+        first = _UP if tick < 10 else (_THROW if tick % 20 < 10 else 0)
+        second = _THROW if tick % 16 < 8 else 0
+        if tick >= 200:
+            first = _SLING | _UP
+        world.update(InputFrame(first, second))
+    return world
+
+
+def _time_call(fn, repeat: int) -> list[float]:
+    samples = []
+    perf = time.perf_counter
+    for _ in range(repeat):
+        start = perf()
+        fn()
+        samples.append((perf() - start) * 1e6)
+    return samples
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time GameWorld.snapshot() and restore().")
+    parser.add_argument("--repeat", type=int, default=5000)
+    parser.add_argument("--budget-us", type=float, default=50.0, help="maximum allowed median per call")
+    args = parser.parse_args(argv)
+
+    world = build_busy_world()
+    snap = world.snapshot()
+    world.restore(snap)  # warm up the restore path once
+
+    snap_us = _time_call(world.snapshot, args.repeat)
+    restore_us = _time_call(lambda: world.restore(snap), args.repeat)
+
+    print(
+        f"world: {len(world.throwables)} bananas, {len(world.hooks)} hooks, "
+        f"{len(world.banana_pickups) + len(world.health_pickups)} pickups, {len(world.platforms)} platforms"
+    )
+    failed = False
+    for label, samples in (("snapshot", snap_us), ("restore", restore_us)):
+        median = statistics.median(samples)
+        p95 = statistics.quantiles(samples, n=20)[-1]
+        status = "ok" if median <= args.budget_us else "OVER BUDGET"
+        failed |= median > args.budget_us
+        print(f"{label:>8}: median {median:6.1f} us  p95 {p95:6.1f} us  [{status}]")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
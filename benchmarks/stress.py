@@ -0,0 +1,113 @@
+"""Stress sweeps: frame time against entity count.
+
+Usage::
+
+    python -m benchmarks.stress                          # sweep every entity kind
+    python -m benchmarks.stress --sweep splats --counts 0,100,400,1600
+
+For each count, a fresh round is filled with that many extra entities of
+the swept kind and run for ``--ticks`` frames of ``GameWorld.update`` plus
+``draw_gameplay``. The printed table shows mean and p95 frame time with a
+bar chart, and the first count whose p95 exceeds the 60 FPS budget
+(16.6 ms) is reported for each kind.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from constants import FPS
+from .scenarios import (
+    add_banana_pickups,
+    add_flying_bananas,
+    add_hooks,
+    add_platforms,
+    add_splats,
+    new_world,
+)
+from .suite import make_renderer, summarize
+
+FRAME_BUDGET_MS = 1000.0 / FPS
+RESTORE_WINDOW = 30  # ticks between restores, so bananas and hooks stay in flight
+
+FILLERS = {
+    "platforms": add_platforms,
+    "pickups": add_banana_pickups,
+    "bananas": add_flying_bananas,
+    "splats": add_splats,
+    "hooks": add_hooks,
+}
+DEFAULT_COUNTS = (0, 25, 50, 100, 200, 400, 800)
+
+
+def measure(kind: str, count: int, ticks: int, renderer, *, vectorized: bool = False) -> dict[str, float]:
+    """Return frame time statistics (ms) for a round holding ``count`` extra ``kind`` entities."""
+    world = new_world(vectorized=vectorized)
+    FILLERS[kind](world, count)
+    snap = world.snapshot()
+    frame_us: list[float] = []
+    perf = time.perf_counter
+    for tick in range(ticks):
+        if tick % RESTORE_WINDOW == 0:
+            world.restore(snap)
+        start = perf()
+        world.update()
+        if renderer is not None:
+            renderer.draw_gameplay(world)
+        frame_us.append((perf() - start) * 1e6)
+    stats = summarize(frame_us)
+    return {"mean_ms": stats["mean_us"] / 1000.0, "p95_ms": stats["p95_us"] / 1000.0}
+
+
+def _bar(value_ms: float, scale_ms: float, width: int = 40) -> str:
+    filled = min(width, int(round(value_ms / scale_ms * width))) if scale_ms > 0 else 0
+    return "#" * filled + "." * (width - filled)
+
+
+def sweep(kind: str, counts: list[int], ticks: int, renderer, *, vectorized: bool = False) -> int | None:
+    """Print one row per count and return the first count over the frame budget."""
+    rows = [(count, measure(kind, count, ticks, renderer, vectorized=vectorized)) for count in counts]
+    scale = max(FRAME_BUDGET_MS, max(stats["p95_ms"] for _, stats in rows))
+    over_budget = None
+    print(f"\n{kind}: frame time vs. extra entities (bar = p95, full width = {scale:.1f} ms)")
+    print(f"{'count':>7} {'mean ms':>9} {'p95 ms':>9}")
+    for count, stats in rows:
+        marker = ""
+        if stats["p95_ms"] > FRAME_BUDGET_MS:
+            marker = "  > budget"
+            if over_budget is None:
+                over_budget = count
+        print(f"{count:7d} {stats['mean_ms']:9.2f} {stats['p95_ms']:9.2f}  {_bar(stats['p95_ms'], scale)}{marker}")
+    return over_budget
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sweep entity counts and report frame time.")
+    parser.add_argument("--sweep", action="append", choices=list(FILLERS), help="entity kind to sweep (repeatable)")
+    parser.add_argument(
+        "--counts",
+        default=",".join(str(count) for count in DEFAULT_COUNTS),
+        help="comma-separated entity counts",
+    )
+    parser.add_argument("--ticks", type=int, default=120, help="frames measured per count")
+    parser.add_argument("--no-render", action="store_true", help="time GameWorld.update only")
+    parser.add_argument("--vectorized", action="store_true", help="step flying bananas with the NumPy engine")
+    args = parser.parse_args(argv)
+
+    counts = sorted({int(part) for part in args.counts.split(",") if part.strip()})
+    renderer = None if args.no_render else make_renderer()
+    limits = {
+        kind: sweep(kind, counts, args.ticks, renderer, vectorized=args.vectorized)
+        for kind in args.sweep or FILLERS
+    }
+
+    print(f"\nframe budget {FRAME_BUDGET_MS:.1f} ms:")
+    for kind, count in limits.items():
+        verdict = f"exceeded at {count}" if count is not None else f"held up to {counts[-1]}"
+        print(f"  {kind:<10} {verdict}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
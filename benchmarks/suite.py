@@ -0,0 +1,222 @@
+"""Scenario benchmarks for the simulation and rendering hot paths.
+
+Usage::
+
+    python -m benchmarks.suite --ticks 600 --out bench.json
+
+Runs every scenario in ``benchmarks.scenarios`` on SDL's dummy video driver,
+timing ``GameWorld.update`` and ``GameSceneRenderer.draw_gameplay`` on each
+tick, plus standalone ``simulate_trajectory`` (and, with NumPy, a batch of
+256 ``simulate_trajectories`` throws) and ``PickupSpawner`` calls.
+Results (per-call latency percentiles in microseconds and ticks per second)
+are printed and optionally written as JSON for comparison across commits.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pygame
+
+from assets import derived_cache_stats
+from constants import (
+    BANANA_THROW_SPEED,
+    GROUND_Y,
+    MAX_PROJECTILE_FALL_SPEED,
+    PROJECTILE_GRAVITY,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from game.headless import init_headless_display
+from game.resources import GameResources
+from game.trajectory import np, simulate_trajectories, simulate_trajectory
+from game.view import GameSceneRenderer
+from .scenarios import SCENARIOS, Scenario, new_world
+
+RESULTS_VERSION = 1
+
+
+def summarize(samples_us: list[float]) -> dict[str, float]:
+    """Reduce per-call timings (microseconds) to the figures stored in the results."""
+    if len(samples_us) < 2:
+        value = samples_us[0] if samples_us else 0.0
+        return {"calls": len(samples_us), "mean_us": value, "p50_us": value,
+                "p95_us": value, "p99_us": value, "max_us": value}
+    cuts = statistics.quantiles(samples_us, n=100, method="inclusive")
+    return {
+        "calls": len(samples_us),
+        "mean_us": statistics.fmean(samples_us),
+        "p50_us": cuts[49],
+        "p95_us": cuts[94],
+        "p99_us": cuts[98],
+        "max_us": max(samples_us),
+    }
+
+
+def make_renderer() -> GameSceneRenderer:
+    init_headless_display()
+    pygame.font.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return GameSceneRenderer(screen, GameResources.load())
+
+
+def run_scenario(scenario: Scenario, ticks: int, renderer: GameSceneRenderer | None) -> dict:
+    """Time ``ticks`` world updates (and draws, when a renderer is given) of one scenario."""
+    world = scenario.build()
+    snap = world.snapshot()
+    update_us: list[float] = []
+    draw_us: list[float] = []
+    perf = time.perf_counter
+    gc.collect()
+    for tick in range(ticks):
+        if tick % scenario.window == 0:
+            world.restore(snap)
+        frame = scenario.inputs(tick)
+        start = perf()
+        world.update(frame)
+        mid = perf()
+        update_us.append((mid - start) * 1e6)
+        if renderer is not None:
+            renderer.draw_gameplay(world)
+            draw_us.append((perf() - mid) * 1e6)
+
+    metrics = {"update": summarize(update_us)}
+    if draw_us:
+        metrics["draw_gameplay"] = summarize(draw_us)
+    total_s = sum(update_us) / 1e6
+    return {
+        "description": scenario.description,
+        "ticks_per_second": ticks / total_s if total_s > 0 else 0.0,
+        "metrics": metrics,
+    }
+
+
+def run_components(repeat: int) -> dict:
+    """Time helpers that run outside the per-tick world update."""
+    world = new_world()
+    spawner = world.spawner
+    perf = time.perf_counter
+
+    trajectory_us: list[float] = []
+    velocity = pygame.Vector2(0.8, -0.6) * BANANA_THROW_SPEED
+    for _ in range(repeat):
+        start = perf()
+        simulate_trajectory(
+            (200, GROUND_Y - 60),
+            velocity,
+            gravity=PROJECTILE_GRAVITY,
+            gravity_scale=1.0,
+            max_fall=MAX_PROJECTILE_FALL_SPEED,
+            steps=90,
+            ground_y=GROUND_Y,
+            screen_width=SCREEN_WIDTH,
+        )
+        trajectory_us.append((perf() - start) * 1e6)
+
+    batch_us: list[float] = []
+    if np is not None:
+        angles = np.linspace(-1.25, 1.25, 256)
+        starts = np.tile((200.0, GROUND_Y - 60.0), (256, 1))
+        velocities = np.stack((np.cos(angles), -np.sin(angles)), axis=1) * BANANA_THROW_SPEED
+        for _ in range(max(1, repeat // 10)):
+            start = perf()
+            simulate_trajectories(
+                starts,
+                velocities,
+                1.0,
+                gravity=PROJECTILE_GRAVITY,
+                max_fall=MAX_PROJECTILE_FALL_SPEED,
+                steps=90,
+                ground_y=GROUND_Y,
+                screen_width=SCREEN_WIDTH,
+            )
+            batch_us.append((perf() - start) * 1e6)
+
+    spawn_us: list[float] = []
+    for _ in range(repeat):
+        if len(world.banana_pickups) >= 3:
+            world.banana_pickups.empty()
+        start = perf()
+        spawner.spawn_banana_if_needed()
+        spawn_us.append((perf() - start) * 1e6)
+
+    platforms_us: list[float] = []
+    for _ in range(max(1, repeat // 10)):
+        start = perf()
+        spawner.spawn_platforms()
+        platforms_us.append((perf() - start) * 1e6)
+
+    metrics = {"simulate_trajectory": summarize(trajectory_us)}
+    if batch_us:
+        metrics["trajectory_batch_256"] = summarize(batch_us)
+    metrics["spawn_banana"] = summarize(spawn_us)
+    metrics["spawn_platforms"] = summarize(platforms_us)
+    return {"description": "standalone helpers", "metrics": metrics}
+
+
+def run_suite(ticks: int = 600, *, names: list[str] | None = None, render: bool = True) -> dict:
+    """Run the selected scenarios (all by default) and return the JSON-ready results."""
+    renderer = make_renderer() if render else None
+    results = {}
+    for name in SCENARIOS:
+        if not names or name in names:
+            results[name] = run_scenario(SCENARIOS[name], ticks, renderer)
+    if not names or "components" in names:
+        results["components"] = run_components(ticks)
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "ticks": ticks,
+            "asset_cache": derived_cache_stats(),
+        },
+        "results": results,
+    }
+
+
+def print_results(report: dict) -> None:
+    print(f"{'scenario':<12} {'metric':<20} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9} {'ticks/s':>10}")
+    for name, result in report["results"].items():
+        rate = result.get("ticks_per_second")
+        for metric, stats in result["metrics"].items():
+            rate_text = f"{rate:10,.0f}" if rate is not None and metric == "update" else " " * 10
+            print(
+                f"{name:<12} {metric:<20} {stats['p50_us']:9.1f} {stats['p95_us']:9.1f} "
+                f"{stats['p99_us']:9.1f} {rate_text}"
+            )
+
+
+def add_suite_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--ticks", type=int, default=600, help="timed ticks per scenario")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[*SCENARIOS, "components"],
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument("--no-render", action="store_true", help="skip timing draw_gameplay")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SlingDuel simulation and rendering.")
+    add_suite_arguments(parser)
+    parser.add_argument("--out", metavar="PATH", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.ticks, names=args.scenario, render=not args.no_render)
+    print_results(report)
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
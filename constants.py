@@ -4,6 +4,10 @@ SCREEN_HEIGHT = 720
 GROUND_Y = 680
 CEILING_Y = -60  # small headroom above visible top before clamping hero
 FPS = 60
+
+# Fixed physics step. Gameplay tuning (gravity, speeds) is expressed per tick at this rate.
+PHYSICS_HZ = 60
+MAX_PHYSICS_STEPS_PER_FRAME = 5  # cap catch-up work after a hitch
 
 COLOR_BG = (94, 129, 162)
 COLOR_SCORE = (64, 64, 64)
@@ -31,3 +35,8 @@ HOOK_THROW_BASE_SPEED = 14 * 1.3
 HOOK_THROW_SPEED_MULTIPLIER = 1.5
 
 MAX_HEALTH = 5
+
+# Periodic gameplay timers (pickup spawns and health regeneration)
+BANANA_SPAWN_INTERVAL_MS = 10000
+REGEN_INTERVAL_MS = 30000
+HEART_SPAWN_INTERVAL_MS = 60000
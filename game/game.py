@@ -1,13 +1,23 @@
 """High level orchestration of the SlingDuel gameplay loop and UI states."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 import pygame
 
-from constants import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
+from constants import (
+    FPS,
+    MAX_PHYSICS_STEPS_PER_FRAME,
+    PHYSICS_HZ,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
 from sprites.hero import Hero
+from inputframe import InputTracker
 from keymap import save_controls, default_controls
+from .profiler import PhaseProfiler
+from .replay import Replay, ReplayPlayer, ReplayRecorder
 from .resources import GameResources
 from .view import GameSceneRenderer
 from .world import GameWorld
@@ -34,18 +44,34 @@ class KeymapEntry:
 class Game:
     """Glue object coordinating input, world updates, and rendering."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        record_path: str | None = None,
+        record_checksums: bool = False,
+        replay_path: str | None = None,
+    ) -> None:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("SlingDuel")
         self.clock = pygame.time.Clock()
+        self._step_ms = 1000.0 / PHYSICS_HZ
+        self._accumulator_ms = 0.0
 
         self.resources = GameResources.load()
         self.test_mode = False
         self.world = GameWorld(test_mode=self.test_mode)
+        # Held actions are tracked from KEYDOWN/KEYUP events and sampled once per tick.
+        self.inputs = InputTracker(self.world.players)
         self.renderer = GameSceneRenderer(self.screen, self.resources)
         self.world.on_self_banana_hit = self._trigger_self_hit_modal
 
+        # Frame phase timings are always collected; F3 toggles their overlay.
+        self.profiler = PhaseProfiler()
+        self.world.profiler = self.profiler
+        self.renderer.profiler = self.profiler
+        self.show_profiler = False
+
         self.game_active = False
         self.paused = False
         self.self_hit_modal_active = False
@@ -71,23 +97,27 @@ class Game:
             "throw": "Throw Banana",
         }
 
-        self._spawn_event = pygame.USEREVENT + 10
-        self._regen_event = pygame.USEREVENT + 11
-        self._heart_spawn_event = pygame.USEREVENT + 12
-
-        pygame.time.set_timer(self._spawn_event, 10000)
-        pygame.time.set_timer(self._regen_event, 30000)
-        pygame.time.set_timer(self._heart_spawn_event, 60000)
-
         self._self_hit_focus_hero: Hero | None = None
 
+        # Optional input recording (``record_path``) or playback (``replay_path``).
+        self._record_path = record_path
+        self._record_checksums = record_checksums
+        self._replay_path = replay_path
+        self._recorder: ReplayRecorder | None = None
+        self._playback: ReplayPlayer | None = None
+
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
     def run(self) -> None:
         while True:
+            frame_ms = self.clock.tick(FPS)
+            profiler = self.profiler
+            profiler.begin_frame()
             self._handle_events()
+            profiler.lap("events")
             if self.self_hit_modal_active:
+                self._accumulator_ms = 0.0
                 if self.world.round_over:
                     self._record_round_end(defer_exit=True)
                 self.renderer.draw_gameplay(self.world)
@@ -99,11 +129,13 @@ class Game:
                 )
             elif self.game_active:
                 if not self.paused:
-                    self.world.update()
-                    self.renderer.draw_gameplay(self.world)
+                    alpha = self._step_world(frame_ms)
+                    profiler.lap("world.step")
+                    self.renderer.draw_gameplay(self.world, alpha)
                     if self.world.round_over:
                         self._record_round_end(defer_exit=False)
                 else:
+                    self._accumulator_ms = 0.0
                     self.renderer.draw_gameplay(self.world)
                     if self.keymap_mode:
                         entries = self._keymap_entries()
@@ -117,6 +149,7 @@ class Game:
                     else:
                         self.renderer.draw_pause_overlay(test_mode=self.test_mode)
             else:
+                self._accumulator_ms = 0.0
                 if self.keymap_mode:
                     self.renderer.draw_start_backdrop()
                     entries = self._keymap_entries()
@@ -135,8 +168,55 @@ class Game:
                         dim=False,
                     )
 
+            profiler.lap("draw.other")
+            if self.show_profiler:
+                self.renderer.draw_profiler_overlay(profiler)
+                profiler.lap("draw.profiler")
             pygame.display.update()
-            self.clock.tick(FPS)
+            profiler.lap("display.update")
+            profiler.end_frame()
+
+    def _step_world(self, frame_ms: float) -> float:
+        """Run as many fixed physics steps as the elapsed time allows.
+
+        Returns the fraction of a step left in the accumulator, which the
+        renderer uses to interpolate between the last two world states.
+        """
+        self._accumulator_ms += frame_ms
+        steps = 0
+        while self._accumulator_ms >= self._step_ms and steps < MAX_PHYSICS_STEPS_PER_FRAME:
+            self._advance_world()
+            self._accumulator_ms -= self._step_ms
+            steps += 1
+            if self.world.round_over or self.self_hit_modal_active or not self.game_active:
+                self._accumulator_ms = 0.0
+                return 1.0
+
+        # After a long hitch, drop the backlog instead of spiralling to catch up.
+        if self._accumulator_ms >= self._step_ms:
+            self._accumulator_ms = 0.0
+        return self._accumulator_ms / self._step_ms
+
+    def _advance_world(self) -> None:
+        if self._playback is not None:
+            if not self._playback.step():
+                self._playback = None
+                self.game_active = False
+                self.paused = False
+            return
+        self.world.update(self.inputs.frame())
+        if self._recorder is not None:
+            self._recorder.record()
+
+    def _save_recording(self) -> None:
+        if self._recorder is None or not self._record_path:
+            return
+        try:
+            self._recorder.replay.save(self._record_path)
+        except OSError as exc:
+            # Quitting should not fail over it, but the user asked for this file.
+            print(f"could not save recording to {self._record_path}: {exc}", file=sys.stderr)
+        self._recorder = None
 
     # ------------------------------------------------------------------
     # Event handling
@@ -144,9 +224,17 @@ class Game:
     def _handle_events(self) -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self._save_recording()
                 pygame.quit()
                 raise SystemExit
 
+            # Track releases even while menus own the keyboard so no action sticks.
+            self.inputs.handle_event(event)
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.show_profiler = not self.show_profiler
+                continue
+
             if self.self_hit_modal_active:
                 if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
                     if pygame.time.get_ticks() >= self._self_hit_unlock_at:
@@ -155,6 +243,7 @@ class Game:
 
             if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
                 self.world.reload_controls()
+                self.inputs.rebind()
 
             if not self.game_active:
                 if event.type == pygame.KEYDOWN:
@@ -176,9 +265,12 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         if self.paused:
                             self.paused = False
+                            self.inputs.sync()
                         else:
                             self.paused = True
                     elif self.paused and event.key == pygame.K_m:
+                        self._save_recording()
+                        self._playback = None
                         self._reset_self_hit_modal()
                         self.paused = False
                         self.game_active = False
@@ -190,13 +282,6 @@ class Game:
                     elif self.paused and event.key == pygame.K_k and not self.keymap_mode:
                         self._resume_after_keymap = True
                         self._enter_keymap_mode()
-                if not self.paused:
-                    if event.type == self._spawn_event:
-                        self.world.spawner.spawn_banana_if_needed()
-                    elif event.type == self._heart_spawn_event:
-                        self.world.spawner.spawn_heart_if_needed()
-                    elif event.type == self._regen_event:
-                        self.world.regenerate_players(0.5)
 
     def _start_round(self) -> None:
         self._dismiss_self_hit_modal()
@@ -211,7 +296,17 @@ class Game:
         self._round_over_recorded = False
         self._round_over_time = 0
         self._resume_after_keymap = False
+        self._accumulator_ms = 0.0
+        self._playback = None
+        # Presses made in the menus (e.g. SPACE to start) must not leak into the first tick.
+        self.inputs.sync()
+        if self._replay_path:
+            self._playback = ReplayPlayer(self.world, Replay.load(self._replay_path))
+            self._playback.start()
+            return
         self.world.begin_round()
+        if self._record_path:
+            self._recorder = ReplayRecorder(self.world, checksums=self._record_checksums)
 
     def _toggle_test_mode(self) -> None:
         self.test_mode = not self.test_mode
@@ -225,6 +320,7 @@ class Game:
         if self._round_over_recorded:
             return
         self._round_over_recorded = True
+        self._save_recording()
         self._round_over_time = pygame.time.get_ticks()
         self.last_winner = self.world.round_winner
         self.last_round_draw = self.world.round_draw
@@ -312,12 +408,14 @@ class Game:
         action = entry.action_key
         hero.controls[action] = new_key
         save_controls(self.world.players.first.controls, self.world.players.second.controls)
+        self.inputs.rebind()
 
     def _reset_keymap_defaults(self) -> None:
         p1_defaults, p2_defaults = default_controls()
         self.world.players.first.controls = p1_defaults
         self.world.players.second.controls = p2_defaults
         save_controls(p1_defaults, p2_defaults)
+        self.inputs.rebind()
         self._keymap_selection = 0
         self._keymap_waiting = False
 
@@ -0,0 +1,127 @@
+"""Display-free driver that steps a GameWorld as fast as the CPU allows.
+
+Usage::
+
+    python -m game.headless --ticks 100000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+
+import pygame
+
+from constants import PHYSICS_HZ
+from .replay import Replay, ReplayPlayer
+from .world import GameWorld
+
+
+def init_headless_display() -> None:
+    """Initialise pygame against SDL's dummy drivers so assets can be converted."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+class HeadlessSimulation:
+    """Runs fixed-timestep world updates without a window or frame limiter."""
+
+    def __init__(
+        self,
+        *,
+        test_mode: bool = False,
+        auto_restart: bool = True,
+        seed: int | None = None,
+        vectorized_projectiles: bool = False,
+    ) -> None:
+        init_headless_display()
+        self.world = GameWorld(test_mode=test_mode, vectorized_projectiles=vectorized_projectiles)
+        self.auto_restart = auto_restart
+        # Round seeds are derived from one master seed so a whole run is reproducible.
+        self._round_seeds = random.Random(seed)
+        self.ticks = 0
+        self.rounds = 0
+        self.begin_round()
+
+    def begin_round(self) -> None:
+        self.world.begin_round(seed=self._round_seeds.getrandbits(32))
+        self.rounds += 1
+
+    def step(self, ticks: int = 1) -> int:
+        """Advance the world by ``ticks`` updates and return the number executed.
+
+        Stops early when a round ends and ``auto_restart`` is disabled.
+        """
+        world = self.world
+        executed = 0
+        for _ in range(ticks):
+            if world.round_over:
+                if not self.auto_restart:
+                    break
+                self.begin_round()
+
+            world.update()
+            executed += 1
+
+        self.ticks += executed
+        return executed
+
+    def play_replay(self, replay: Replay) -> ReplayPlayer:
+        """Re-simulate a recorded round from its inputs and return the finished player.
+
+        ``player.tick`` is the number of ticks executed and ``player.desync_tick``
+        the first tick whose checksum disagreed with the recording, if any.
+        """
+        player = ReplayPlayer(self.world, replay)
+        player.start()
+        self.rounds += 1
+        while player.step():
+            pass
+        self.ticks += player.tick
+        return player
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run SlingDuel headless and report simulation speed.")
+    parser.add_argument("--ticks", type=int, default=10000, help="number of world updates to run")
+    parser.add_argument("--test-mode", action="store_true", help="enable test mode (infinite bananas)")
+    parser.add_argument("--seed", type=int, default=None, help="master seed for round layouts")
+    parser.add_argument("--replay", metavar="PATH", help="re-simulate a recorded replay instead of idle ticks")
+    parser.add_argument("--vectorized", action="store_true", help="step flying bananas with the NumPy engine")
+    args = parser.parse_args(argv)
+
+    sim = HeadlessSimulation(test_mode=args.test_mode, seed=args.seed, vectorized_projectiles=args.vectorized)
+    replay = Replay.load(args.replay) if args.replay else None
+    player = None
+    start = time.perf_counter()
+    if replay is not None:
+        player = sim.play_replay(replay)
+        executed = player.tick
+    else:
+        executed = sim.step(args.ticks)
+    elapsed = time.perf_counter() - start
+
+    rate = executed / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"{executed} ticks in {elapsed:.3f}s "
+        f"({rate:,.0f} ticks/s, {rate / PHYSICS_HZ:,.1f}x real time, {sim.rounds} round(s))"
+    )
+    if player is not None and replay.checksums:
+        if player.desync_tick is None:
+            print(f"checksums match for all {executed} ticks")
+        else:
+            print(f"DESYNC: checksum differs from the recording at tick {player.desync_tick}")
+            return 1
+    return 0
+
+
+__all__ = ["HeadlessSimulation", "init_headless_display"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
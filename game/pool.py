@@ -0,0 +1,100 @@
+"""Recycling of banana and hook sprites so throws do not allocate."""
+from __future__ import annotations
+
+from typing import Iterable, TYPE_CHECKING
+
+from assets import get_banana_frames, get_banana_splashed
+from simclock import SimClock
+from sprites.banana import Banana
+from sprites.sling import Sling, hook_images
+
+if TYPE_CHECKING:
+    from sprites.hero import Hero
+
+
+class ProjectilePool:
+    """Hands out ``Banana`` and ``Sling`` sprites for one world, reusing retired ones.
+
+    There is no explicit release: a banana is free again once it has left
+    every group, and a hook once it has also been let go by its hero (heroes
+    hold on to finished hooks until their next update). Reused sprites are
+    ``reset`` so they behave exactly like new ones. Every banana shares one
+    set of rotated frames and splat images and every hook one pair of images.
+
+    ``probe`` builds spare sprites that are never handed out or grouped.
+    ``GameWorld.predict_impact`` steps one through a throw with ``fly``, the
+    same per-tick flight code live projectiles run. ``fly`` touches nothing
+    but the sprite itself, and ``level`` lets an ownerless probe use the
+    world's platform index.
+    """
+
+    def __init__(self, clock: SimClock, players: Iterable["Hero"], *,
+                 bananas: int = 8, hooks: int = 2) -> None:
+        self._clock = clock
+        self._players = tuple(players)
+        self.banana_frames = get_banana_frames()
+        self.splat_image = get_banana_splashed()
+        self.stepped_image = get_banana_splashed(rotated=True)
+        self.hook_images = hook_images()
+        self._bananas = [self._new_banana((0, 0), (0, 0), None) for _ in range(bananas)]
+        self._hooks = [self._new_sling((0, 0), (0, 0), None) for _ in range(hooks)]
+        self._banana_cursor = 0
+        self._hook_cursor = 0
+        self.created = bananas + hooks  # sprites built so far, including the preallocated ones
+        self.reused = 0
+
+    def banana(self, pos, velocity, owner: "Hero" | None = None) -> Banana:
+        """Return a banana in flight from ``pos``; the caller adds it to a group."""
+        sprites = self._bananas
+        count = len(sprites)
+        # Round-robin scan so the most recently retired sprites rest the longest.
+        for step in range(count):
+            index = (self._banana_cursor + step) % count
+            banana = sprites[index]
+            if not banana.alive():
+                self._banana_cursor = index + 1
+                self.reused += 1
+                banana.reset(pos, velocity, owner)
+                return banana
+        banana = self._new_banana(pos, velocity, owner)
+        sprites.append(banana)
+        self.created += 1
+        return banana
+
+    def sling(self, pos, velocity, owner: "Hero" | None = None) -> Sling:
+        """Return a hook in flight from ``pos``; the caller adds it to a group."""
+        sprites = self._hooks
+        count = len(sprites)
+        for step in range(count):
+            index = (self._hook_cursor + step) % count
+            hook = sprites[index]
+            if not hook.alive() and all(player.hook_sprite is not hook for player in self._players):
+                self._hook_cursor = index + 1
+                self.reused += 1
+                hook.reset(pos, velocity, owner)
+                return hook
+        hook = self._new_sling(pos, velocity, owner)
+        sprites.append(hook)
+        self.created += 1
+        return hook
+
+    def probe(self, *, hook: bool, clock: SimClock, level) -> Banana | Sling:
+        """Return a spare banana (or hook) on ``clock`` whose platform checks go through ``level``."""
+        if hook:
+            sprite = Sling((0, 0), (0, 0), clock=clock, images=self.hook_images)
+        else:
+            sprite = Banana((0, 0), (0, 0), clock=clock, frames=self.banana_frames,
+                            splat_image=self.splat_image, stepped_image=self.stepped_image)
+        sprite.level = level
+        return sprite
+
+    def _new_banana(self, pos, velocity, owner) -> Banana:
+        return Banana(pos, velocity, owner=owner, clock=self._clock,
+                      frames=self.banana_frames, splat_image=self.splat_image,
+                      stepped_image=self.stepped_image)
+
+    def _new_sling(self, pos, velocity, owner) -> Sling:
+        return Sling(pos, velocity, owner=owner, clock=self._clock, images=self.hook_images)
+
+
+__all__ = ["ProjectilePool"]
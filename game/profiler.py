@@ -0,0 +1,102 @@
+"""Per-frame phase timings kept in fixed-size ring buffers.
+
+Code being measured calls ``lap(phase)`` when a phase finishes; the time
+since the previous lap is charged to that phase. Laps with the same name in
+one frame (e.g. several physics steps) are summed, and ``end_frame`` pushes
+one sample per known phase so percentiles describe whole frames.
+"""
+from __future__ import annotations
+
+from array import array
+from time import perf_counter
+
+FRAME_HISTORY = 600  # 10 s at 60 FPS
+PERCENTILES = (50, 95, 99)
+
+
+class RingBuffer:
+    """Fixed-capacity float history that overwrites its oldest sample."""
+
+    __slots__ = ("values", "index", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.values = array("d", bytes(8 * capacity))
+        self.index = 0
+        self.count = 0
+
+    def append(self, value: float) -> None:
+        values = self.values
+        values[self.index] = value
+        self.index = (self.index + 1) % len(values)
+        if self.count < len(values):
+            self.count += 1
+
+    def last(self) -> float:
+        return self.values[self.index - 1] if self.count else 0.0
+
+    def percentiles(self, qs: tuple[int, ...] = PERCENTILES) -> tuple[float, ...]:
+        """Nearest-rank percentiles of the stored samples."""
+        if not self.count:
+            return tuple(0.0 for _ in qs)
+        ordered = sorted(self.values[: self.count])
+        top = self.count - 1
+        return tuple(ordered[min(top, (q * self.count + 99) // 100 - 1)] for q in qs)
+
+
+class PhaseProfiler:
+    """Lap timer that attributes each frame's wall time to named phases."""
+
+    def __init__(self, capacity: int = FRAME_HISTORY) -> None:
+        self.capacity = capacity
+        self.rings: dict[str, RingBuffer] = {}
+        self.frame = RingBuffer(capacity)
+        self._current: dict[str, float] = {}
+        self._mark = perf_counter()
+
+    def begin_frame(self) -> None:
+        self._current.clear()
+        self._mark = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = perf_counter()
+        current = self._current
+        current[phase] = current.get(phase, 0.0) + (now - self._mark)
+        self._mark = now
+
+    def end_frame(self) -> None:
+        current = self._current
+        rings = self.rings
+        total = 0.0
+        for phase, seconds in current.items():
+            if phase not in rings:
+                rings[phase] = RingBuffer(self.capacity)
+            total += seconds
+        for phase, ring in rings.items():
+            ring.append(current.get(phase, 0.0) * 1000.0)
+        self.frame.append(total * 1000.0)
+
+    def stats(self) -> list[tuple[str, float, tuple[float, ...]]]:
+        """Return ``(phase, last_ms, (p50, p95, p99))`` in first-seen order, frame total last."""
+        rows = [(phase, ring.last(), ring.percentiles()) for phase, ring in self.rings.items()]
+        rows.append(("frame", self.frame.last(), self.frame.percentiles()))
+        return rows
+
+
+class NullProfiler:
+    """Stand-in used when nobody is measuring; every call is a no-op."""
+
+    __slots__ = ()
+
+    def begin_frame(self) -> None:
+        pass
+
+    def lap(self, phase: str) -> None:
+        pass
+
+    def end_frame(self) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+__all__ = ["FRAME_HISTORY", "NULL_PROFILER", "NullProfiler", "PhaseProfiler", "RingBuffer"]
@@ -0,0 +1,254 @@
+"""Optional NumPy engine that steps every flying banana in one vectorized pass.
+
+Flying bananas keep their kinematics (rect, velocity, rotation frame) in
+structure-of-arrays form. Each tick the engine applies gravity and the fall
+speed clamp, moves and rotates them, runs the ground, platform and
+off-screen tests for all of them at once, and then writes the results back
+to the sprites so hit tests, drawing and snapshots see ordinary ``Banana``
+objects. Bananas that land hand over to their own ``Banana`` methods, as do
+splats and anything else in the group, so the outcome of every tick matches
+``Group.update`` exactly.
+
+Enable it with ``GameWorld(vectorized_projectiles=True)``. NumPy is not a
+hard dependency: ``NUMPY_AVAILABLE`` says whether the engine can be used.
+"""
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+import pygame
+
+from constants import GROUND_Y, MAX_PROJECTILE_FALL_SPEED, PROJECTILE_GRAVITY, SCREEN_WIDTH
+from sprites.banana import Banana
+
+NUMPY_AVAILABLE = np is not None
+
+_FRAME_COUNT = 4  # Banana cycles through four quarter-turn frames
+_ROTATION_SPEED = 0.3
+
+
+def _round_half_away(values):
+    """Round like ``Rect`` attribute assignment: halves move away from zero."""
+    whole = np.trunc(values)
+    return whole + np.copysign(np.abs(values - whole) >= 0.5, values)
+
+
+class BananaEngine:
+    """Structure-of-arrays stepping for flying ``Banana`` sprites.
+
+    Every flying banana is given a slot the first time it is seen. A slot is
+    dropped once its banana leaves the group or stops flying, or when its
+    ``rect`` is replaced (``reset`` and ``restore`` do that), after which the
+    sprite is read back in from scratch.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        if np is None:
+            raise RuntimeError("the vectorized projectile engine needs NumPy")
+        self._x = np.zeros(capacity)
+        self._y = np.zeros(capacity)
+        self._w = np.zeros(capacity)
+        self._h = np.zeros(capacity)
+        self._vx = np.zeros(capacity)
+        self._vy = np.zeros(capacity)
+        self._frame = np.zeros(capacity)
+        self._frame_w = np.zeros((capacity, _FRAME_COUNT))
+        self._frame_h = np.zeros((capacity, _FRAME_COUNT))
+        self._slots: dict[Banana, int] = {}
+        self._rects: list[pygame.Rect | None] = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        self._swept = np.zeros((4, 0))  # left, top, right, bottom covered by each slot's last move
+        self._swept_sprites: list[Banana] = []
+        self._platforms_key: tuple | None = None
+        self._stand = np.zeros((3, 0))  # top, left, right per platform, sorted by (top, group order)
+
+    def __contains__(self, sprite) -> bool:
+        """True while ``sprite`` is a flying banana stepped by this engine."""
+        return sprite in self._slots
+
+    def near(self, rects: list[pygame.Rect]) -> set[Banana]:
+        """Engine bananas whose path over the last step touched any of ``rects``.
+
+        Lets hit tests skip the bananas that cannot have reached a target.
+        """
+        left, top, right, bottom = self._swept
+        if not left.size or not rects:
+            return set()
+        hit = np.zeros(left.size, dtype=bool)
+        for rect in rects:
+            hit |= (left <= rect.right) & (right >= rect.left) & (top <= rect.bottom) & (bottom >= rect.top)
+        sprites = self._swept_sprites
+        return {sprites[index] for index in np.flatnonzero(hit).tolist()}
+
+    def step(self, throwables: pygame.sprite.Group, platforms: pygame.sprite.Group | None) -> None:
+        """Advance ``throwables`` one tick; a drop-in for ``throwables.update(platforms)``."""
+        order: list[tuple[pygame.sprite.Sprite, int]] = []
+        previous = self._slots
+        self._slots = current = {}
+        for sprite in throwables.sprites():
+            slot = -1
+            if type(sprite) is Banana and sprite.state == "flying" and len(sprite.frames) == _FRAME_COUNT:
+                slot = previous.pop(sprite, -1)
+                if slot >= 0 and self._rects[slot] is not sprite.rect:
+                    self._release(slot)
+                    slot = -1
+                if slot < 0:
+                    slot = self._adopt(sprite)
+                current[sprite] = slot
+            order.append((sprite, slot))
+        for slot in previous.values():
+            self._release(slot)
+
+        if not current:
+            self._swept = self._swept[:, :0]
+            self._swept_sprites = []
+            for sprite, _ in order:
+                sprite.update(platforms)
+            return
+
+        slots = np.fromiter(current.values(), dtype=np.intp, count=len(current))
+        self._swept_sprites = list(current)
+        landed_top, splat = self._advance(slots, platforms)
+
+        # Write back in group order so landings join ``world.splats`` in the same order as before.
+        rows = zip(
+            self._x[slots].tolist(), self._y[slots].tolist(), self._w[slots].tolist(), self._h[slots].tolist(),
+            self._vy[slots].tolist(), self._frame[slots].tolist(), landed_top.tolist(), splat.tolist(),
+        )
+        for sprite, slot in order:
+            if slot < 0:
+                sprite.update(platforms)
+                continue
+            x, y, w, h, vy, frame, top, ends_flight = next(rows)
+            sprite._prev_bottom = sprite.rect.bottom
+            sprite.rect.update(int(x), int(y), int(w), int(h))
+            sprite.velocity.y = vy
+            sprite.frame_index = frame
+            sprite.image = sprite.frames[int(frame)]
+            if ends_flight:
+                if top == top:  # NaN marks an off-screen exit rather than a landing
+                    sprite.rect.bottom = int(top)
+                del current[sprite]
+                self._release(slot)
+                sprite._persist_splat()
+
+    # ------------------------------------------------------------------
+    # Vectorized tick
+    # ------------------------------------------------------------------
+    def _advance(self, slots, platforms):
+        """Move the banana ``slots`` one tick; return the landing top (NaN if none) and a done mask."""
+        x, y, w, h = self._x[slots], self._y[slots], self._w[slots], self._h[slots]
+        prev_bottom = y + h
+        center_x = x + w // 2
+
+        vy = np.minimum(self._vy[slots] + PROJECTILE_GRAVITY, MAX_PROJECTILE_FALL_SPEED)
+        x = _round_half_away(x + self._vx[slots])
+        y = _round_half_away(y + vy)
+
+        # Rotate about the center; frame sizes differ when the image is not square.
+        frame = np.mod(self._frame[slots] + _ROTATION_SPEED, _FRAME_COUNT)
+        index = frame.astype(np.intp)
+        new_w = self._frame_w[slots, index]
+        new_h = self._frame_h[slots, index]
+        mid_x = x + w // 2
+        mid_y = y + h // 2
+        x = mid_x - new_w // 2
+        y = mid_y - new_h // 2
+        bottom = y + new_h
+        dx = (x + new_w // 2) - center_x
+
+        falling = vy >= 0
+        landed_top = np.full(len(slots), np.nan)
+        on_ground = falling & (prev_bottom <= GROUND_Y) & (bottom >= GROUND_Y)
+        landed_top[on_ground] = GROUND_Y
+
+        stand = self._stand_lines(platforms)
+        if stand.shape[1]:
+            candidates = np.flatnonzero(falling & ~on_ground)
+            if candidates.size:
+                tops, lefts, rights = stand
+                pb = prev_bottom[candidates, None]
+                bot = bottom[candidates, None]
+                crossed = (pb <= tops) & (tops <= bot)
+                span = bot - pb
+                toi = np.where(span == 0, 0.0, (tops - pb) / np.where(span == 0, 1.0, span))
+                left = x[candidates, None] - dx[candidates, None] * (1.0 - toi)
+                hits = crossed & (left - 1 < rights) & (left + new_w[candidates, None] + 1 > lefts)
+                # Stand lines are sorted, so the first hit is the one a linear scan would pick.
+                has_hit = hits.any(axis=1)
+                first = hits.argmax(axis=1)
+                landed = candidates[has_hit]
+                landed_top[landed] = tops[first[has_hit]]
+
+        landed = ~np.isnan(landed_top)
+        off_screen = ~landed & ((x + new_w < 0) | (x > SCREEN_WIDTH))
+
+        # Swept bounds also cover the new rect moved back by the center's travel, which is
+        # how GameWorld's hit test rewinds a banana whose image changed size.
+        old_x, old_y = self._x[slots], self._y[slots]
+        back_x = old_x + w // 2 - new_w // 2
+        back_y = old_y + h // 2 - new_h // 2
+        self._swept = np.array([
+            np.minimum(np.minimum(old_x, x), back_x),
+            np.minimum(np.minimum(old_y, y), back_y),
+            np.maximum(np.maximum(old_x + w, x + new_w), back_x + new_w),
+            np.maximum(np.maximum(old_y + h, y + new_h), back_y + new_h),
+        ])
+        self._x[slots] = x
+        self._y[slots] = y
+        self._w[slots] = new_w
+        self._h[slots] = new_h
+        self._vy[slots] = vy
+        self._frame[slots] = frame
+        return landed_top, landed | off_screen
+
+    def _stand_lines(self, platforms):
+        if not platforms:
+            return self._stand[:, :0]
+        version = getattr(platforms, "version", None)
+        key = (id(platforms), version) if version is not None else None
+        if key is None or key != self._platforms_key:
+            lines = sorted(
+                ((platform.stand_rect.top, order, platform.stand_rect) for order, platform in enumerate(platforms)),
+                key=lambda line: (line[0], line[1]),
+            )
+            self._stand = np.array(
+                [[line[0] for line in lines], [line[2].left for line in lines], [line[2].right for line in lines]],
+                dtype=float,
+            ).reshape(3, len(lines))
+            self._platforms_key = key
+        return self._stand
+
+    # ------------------------------------------------------------------
+    # Slots
+    # ------------------------------------------------------------------
+    def _adopt(self, banana: Banana) -> int:
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        rect = banana.rect
+        self._rects[slot] = rect
+        self._x[slot], self._y[slot], self._w[slot], self._h[slot] = rect.x, rect.y, rect.w, rect.h
+        self._vx[slot], self._vy[slot] = banana.velocity.x, banana.velocity.y
+        self._frame[slot] = banana.frame_index
+        for index, frame in enumerate(banana.frames):
+            self._frame_w[slot, index], self._frame_h[slot, index] = frame.get_size()
+        return slot
+
+    def _release(self, slot: int) -> None:
+        self._rects[slot] = None
+        self._free.append(slot)
+
+    def _grow(self) -> None:
+        old = len(self._x)
+        for name in ("_x", "_y", "_w", "_h", "_vx", "_vy", "_frame", "_frame_w", "_frame_h"):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self._rects.extend([None] * old)
+        self._free.extend(range(2 * old - 1, old - 1, -1))
+
+
+__all__ = ["BananaEngine", "NUMPY_AVAILABLE"]
@@ -0,0 +1,283 @@
+"""Compact binary recording and playback of per-tick player inputs.
+
+A replay stores the round seed, the heroes' starting positions, and one
+action bitmask per player per tick (see ``keymap.ACTIONS``). Identical
+consecutive ticks are run-length encoded and the run table is zlib
+compressed, which keeps a full match to a few kilobytes.
+
+Periodic keyframes (full world states) follow the inputs, with an index at
+the end of the file, so seeking restores the nearest keyframe and only
+re-simulates the ticks after it. An optional stream of per-tick
+``GameWorld.checksum()`` values lets playback detect the first tick where a
+re-simulation diverges from the recording.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, TYPE_CHECKING
+
+from constants import GROUND_Y
+from inputframe import InputFrame
+
+if TYPE_CHECKING:
+    from .world import GameWorld
+
+
+REPLAY_MAGIC = b"SDRP"
+REPLAY_VERSION = 6  # bumped whenever the format or the simulation changes playback
+KEYFRAME_INTERVAL_TICKS = 900  # 15 s of simulation between keyframes
+
+# Per-tick world flags stored alongside the input masks.
+FLAG_TEST_MODE = 0x01
+
+# magic, version, seed, start x (p1, p2), tick count, compressed run bytes, compressed checksum bytes
+_HEADER = struct.Struct("<4sBIhhIII")
+# run length, flags, player 1 mask, player 2 mask
+_RUN = struct.Struct("<HBBB")
+_MAX_RUN = 0xFFFF
+# keyframe index: entry count, then (tick, byte offset, byte length) per keyframe
+_INDEX_COUNT = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<III")
+# trailer: byte offset of the keyframe index, trailer magic
+_TRAILER = struct.Struct("<I4s")
+_TRAILER_MAGIC = b"SDKI"
+
+
+def encode_keyframe(state: dict) -> bytes:
+    return zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def decode_keyframe(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+@dataclass(slots=True)
+class Replay:
+    """Inputs for a single round, run-length encoded as ``[count, flags, p1, p2]``.
+
+    ``keyframes`` holds ``(tick, encoded_state)`` pairs in tick order, where the
+    state is the world after that many ticks have been simulated.
+    ``checksums`` is either empty or holds the world checksum after every tick.
+    """
+
+    seed: int
+    start_x: tuple[int, int]
+    runs: list[list[int]] = field(default_factory=list)
+    keyframes: list[tuple[int, bytes]] = field(default_factory=list)
+    checksums: list[int] = field(default_factory=list)
+
+    @property
+    def ticks(self) -> int:
+        return sum(run[0] for run in self.runs)
+
+    @property
+    def initial_flags(self) -> int:
+        return self.runs[0][1] if self.runs else 0
+
+    def append(self, flags: int, first: int, second: int) -> None:
+        runs = self.runs
+        if runs:
+            last = runs[-1]
+            if last[0] < _MAX_RUN and last[1] == flags and last[2] == first and last[3] == second:
+                last[0] += 1
+                return
+        runs.append([1, flags, first, second])
+
+    def frames(self, start_tick: int = 0) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(flags, player1_mask, player2_mask)`` for every tick from ``start_tick``."""
+        skip = start_tick
+        for count, flags, first, second in self.runs:
+            if skip >= count:
+                skip -= count
+                continue
+            frame = (flags, first, second)
+            for _ in range(count - skip):
+                yield frame
+            skip = 0
+
+    def keyframe_before(self, tick: int) -> tuple[int, bytes] | None:
+        """Return the latest keyframe at or before ``tick``, if any."""
+        idx = bisect.bisect_right([kf_tick for kf_tick, _ in self.keyframes], tick)
+        return self.keyframes[idx - 1] if idx else None
+
+    # ------------------------------------------------------------------
+    # Serialisation
+    # ------------------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        table = b"".join(_RUN.pack(*run) for run in self.runs)
+        payload = zlib.compress(table, 9)
+        sums = b""
+        if self.checksums:
+            sums = zlib.compress(struct.pack(f"<{len(self.checksums)}I", *self.checksums), 6)
+        header = _HEADER.pack(
+            REPLAY_MAGIC,
+            REPLAY_VERSION,
+            self.seed & 0xFFFFFFFF,
+            self.start_x[0],
+            self.start_x[1],
+            self.ticks,
+            len(payload),
+            len(sums),
+        )
+        chunks = [header, payload, sums]
+        offset = len(header) + len(payload) + len(sums)
+        index = [_INDEX_COUNT.pack(len(self.keyframes))]
+        for tick, blob in self.keyframes:
+            chunks.append(blob)
+            index.append(_INDEX_ENTRY.pack(tick, offset, len(blob)))
+            offset += len(blob)
+        chunks.extend(index)
+        chunks.append(_TRAILER.pack(offset, _TRAILER_MAGIC))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if len(data) < _HEADER.size:
+            raise ValueError("Replay data is truncated")
+        magic, version, seed, x1, x2, ticks, payload_len, sums_len = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a SlingDuel replay")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        start = _HEADER.size
+        table = zlib.decompress(data[start:start + payload_len])
+        runs = [list(run) for run in _RUN.iter_unpack(table)]
+        checksums: list[int] = []
+        if sums_len:
+            start += payload_len
+            raw = zlib.decompress(data[start:start + sums_len])
+            checksums = list(struct.unpack(f"<{len(raw) // 4}I", raw))
+
+        index_offset, trailer_magic = _TRAILER.unpack_from(data, len(data) - _TRAILER.size)
+        if trailer_magic != _TRAILER_MAGIC:
+            raise ValueError("Replay keyframe index is missing")
+        (count,) = _INDEX_COUNT.unpack_from(data, index_offset)
+        keyframes: list[tuple[int, bytes]] = []
+        entry_offset = index_offset + _INDEX_COUNT.size
+        for _ in range(count):
+            tick, offset, length = _INDEX_ENTRY.unpack_from(data, entry_offset)
+            keyframes.append((tick, data[offset:offset + length]))
+            entry_offset += _INDEX_ENTRY.size
+
+        replay = cls(seed=seed, start_x=(x1, x2), runs=runs, keyframes=keyframes, checksums=checksums)
+        if replay.ticks != ticks:
+            raise ValueError("Replay tick count does not match its input table")
+        if checksums and len(checksums) != ticks:
+            raise ValueError("Replay checksum stream does not match its tick count")
+        return replay
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Replay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayRecorder:
+    """Captures the inputs each hero consumed, one entry per world update.
+
+    Create it right after ``GameWorld.begin_round`` and call ``record`` after
+    every ``GameWorld.update``. A keyframe is stored every
+    ``keyframe_interval`` ticks (0 disables keyframes); ``checksums`` also
+    streams the world checksum of every tick into the replay.
+    """
+
+    def __init__(
+        self,
+        world: "GameWorld",
+        *,
+        keyframe_interval: int = KEYFRAME_INTERVAL_TICKS,
+        checksums: bool = False,
+    ) -> None:
+        self.world = world
+        self.keyframe_interval = keyframe_interval
+        self.checksums = checksums
+        self._ticks = 0
+        self.replay = Replay(
+            seed=world.round_seed or 0,
+            start_x=(world.players.first.rect.centerx, world.players.second.rect.centerx),
+        )
+
+    def record(self) -> None:
+        world = self.world
+        flags = FLAG_TEST_MODE if world.test_mode else 0
+        self.replay.append(flags, world.players.first.last_actions, world.players.second.last_actions)
+        if self.checksums:
+            self.replay.checksums.append(world.checksum())
+        self._ticks += 1
+        if self.keyframe_interval and self._ticks % self.keyframe_interval == 0:
+            self.replay.keyframes.append((self._ticks, encode_keyframe(world.export_state())))
+
+
+class ReplayPlayer:
+    """Feeds recorded inputs back into a world in place of the keyboard.
+
+    When the replay carries checksums, every simulated tick is compared with
+    the recording and ``desync_tick`` is set to the first tick that differs.
+    """
+
+    def __init__(self, world: "GameWorld", replay: Replay) -> None:
+        self.world = world
+        self.replay = replay
+        self.tick = 0
+        self.desync_tick: int | None = None
+        self._frames = replay.frames()
+
+    def start(self) -> None:
+        """Begin the recorded round with its original seed and hero placement."""
+        world = self.world
+        world.set_test_mode(bool(self.replay.initial_flags & FLAG_TEST_MODE))
+        world.begin_round(seed=self.replay.seed)
+        for hero, x_pos in zip(world.players, self.replay.start_x):
+            hero.rect.midbottom = (x_pos, GROUND_Y)
+        self.tick = 0
+        self._frames = self.replay.frames()
+
+    @property
+    def finished(self) -> bool:
+        return self.tick >= self.replay.ticks
+
+    def seek(self, tick: int) -> None:
+        """Jump to the world state after ``tick`` recorded ticks.
+
+        Restores the nearest preceding keyframe and simulates only the ticks
+        after it, so the cost is bounded by the keyframe interval.
+        """
+        tick = max(0, min(tick, self.replay.ticks))
+        keyframe = self.replay.keyframe_before(tick)
+        kf_tick = keyframe[0] if keyframe is not None else 0
+        # Simulating forward from the current position is never slower than restoring.
+        if not kf_tick <= self.tick <= tick:
+            if keyframe is None:
+                self.start()
+            else:
+                self.world.import_state(decode_keyframe(keyframe[1]))
+                self.tick = kf_tick
+                self._frames = self.replay.frames(kf_tick)
+        while self.tick < tick and self.step():
+            pass
+
+    def step(self) -> bool:
+        """Run one recorded tick; return False once the replay is exhausted."""
+        frame = next(self._frames, None)
+        if frame is None:
+            return False
+        flags, first, second = frame
+        self.world.set_test_mode(bool(flags & FLAG_TEST_MODE))
+        self.world.update(InputFrame(first, second))
+        checksums = self.replay.checksums
+        if checksums and self.desync_tick is None:
+            if self.world.checksum() != checksums[self.tick]:
+                self.desync_tick = self.tick + 1
+        self.tick += 1
+        return True
+
+
+__all__ = ["Replay", "ReplayPlayer", "ReplayRecorder", "decode_keyframe", "encode_keyframe"]
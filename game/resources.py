@@ -13,7 +13,7 @@ from assets import (
     get_heart,
     get_heart_half,
     get_hook_image,
-    get_stars_image,
+    get_stars_frames,
     get_target,
 )
 
@@ -50,6 +50,7 @@ class GameResources:
 
     game_font: pygame.font.Font
     name_font: pygame.font.Font
+    debug_font: pygame.font.Font
     sky: pygame.Surface
     ground: pygame.Surface
     target: pygame.Surface
@@ -69,29 +70,21 @@ class GameResources:
     def load(cls) -> "GameResources":
         sky, ground = get_background()
         target = get_target()
-        stars = get_stars_image()
-        stars_frames: tuple[pygame.Surface, ...]
-        if stars:
-            rotated_90 = pygame.transform.rotate(stars, 90)
-            rotated_180 = pygame.transform.rotate(stars, 180)
-            rotated_270 = pygame.transform.rotate(stars, 270)
-            stars_frames = (stars, rotated_90, rotated_180, rotated_270)
-        else:
-            stars_frames = tuple()
 
         return cls(
             game_font=get_font(size=100),
             name_font=get_font(size=36),
+            debug_font=get_font(size=24),
             sky=sky,
             ground=ground,
             target=target,
-            target_left=pygame.transform.flip(target, True, False),
+            target_left=get_target(flipped=True),
             heart=get_heart(),
             heart_half=get_heart_half(),
             banana_icon=get_banana_image(),
             banana_splash=get_banana_splashed(),
             hook_icon=get_hook_image(),
-            hit_stars_frames=stars_frames,
+            hit_stars_frames=get_stars_frames(),
             self_hit_message=_overlay_slot(),
             self_hit_banner=_overlay_slot(_HUD_BUFFER_ALT),
         )
@@ -1,7 +1,7 @@
 """Spawn logic for platforms, bananas, and health pickups."""
 from __future__ import annotations
 
-from random import choice, randint
+import random
 from typing import Iterable, TYPE_CHECKING
 
 import pygame
@@ -10,6 +10,7 @@ from constants import GROUND_Y, SCREEN_WIDTH
 from sprites.banana import BananaPickup
 from sprites.health import HealthPickup
 from sprites.platform import Platform
+from sprites.spatial import IndexedGroup
 from assets import get_floor_images
 
 if TYPE_CHECKING:
@@ -19,12 +20,14 @@ if TYPE_CHECKING:
 class PickupSpawner:
     """Responsible for placing platforms and pickups without overlap."""
 
-    def __init__(self, *, platforms: pygame.sprite.Group, banana_pickups: pygame.sprite.Group,
-                 health_pickups: pygame.sprite.Group, players: Iterable["Hero"]) -> None:
+    def __init__(self, *, platforms: IndexedGroup, banana_pickups: IndexedGroup,
+                 health_pickups: IndexedGroup, players: Iterable["Hero"],
+                 rng: random.Random | None = None) -> None:
         self._platforms = platforms
         self._banana_pickups = banana_pickups
         self._health_pickups = health_pickups
         self._players = list(players)
+        self._rng = rng if rng is not None else random.Random()
 
         self._platform_spawns_since_ground = 0
         self._ground_ready = False
@@ -51,12 +54,12 @@ class PickupSpawner:
 
         choices: list[tuple[int, int]] = []
         while candidates and len(choices) < 8:
-            idx = randint(0, len(candidates) - 1)
+            idx = self._rng.randint(0, len(candidates) - 1)
             choices.append(candidates.pop(idx))
 
         for (c_x, c_y) in choices:
-            img = choice(floor_imgs)
-            platform = Platform(img, midtop=(c_x, c_y))
+            variant = self._rng.randrange(len(floor_imgs))
+            platform = Platform(floor_imgs[variant], midtop=(c_x, c_y), variant=variant)
             self._platforms.add(platform)
 
     def spawn_banana_if_needed(self) -> None:
@@ -90,7 +93,7 @@ class PickupSpawner:
             upper_platforms = self._platforms.sprites()
 
         for _ in range(20):
-            platform = choice(upper_platforms)
+            platform = self._rng.choice(upper_platforms)
             if self._platform_has_pickup(platform):
                 continue
             x_pos = self._random_x_on_platform(platform)
@@ -99,6 +102,13 @@ class PickupSpawner:
                 self._health_pickups.add(candidate)
                 return
 
+    def get_counters(self) -> tuple[int, bool]:
+        """Return the ground-spawn bookkeeping needed to resume spawning exactly."""
+        return self._platform_spawns_since_ground, self._ground_ready
+
+    def set_counters(self, counters: tuple[int, bool]) -> None:
+        self._platform_spawns_since_ground, self._ground_ready = counters
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -107,7 +117,7 @@ class PickupSpawner:
         if ground_count >= 1:
             return False
 
-        x_pos = randint(60, SCREEN_WIDTH - 60)
+        x_pos = self._rng.randint(60, SCREEN_WIDTH - 60)
         candidate = BananaPickup(x_pos, y_bottom=GROUND_Y)
         if self._non_overlapping(candidate.rect, (self._banana_pickups, self._health_pickups)):
             self._banana_pickups.add(candidate)
@@ -122,7 +132,7 @@ class PickupSpawner:
             return False
 
         for _ in range(12):
-            platform = choice(platforms)
+            platform = self._rng.choice(platforms)
             if self._platform_has_pickup(platform):
                 continue
             x_pos = self._random_x_on_platform(platform)
@@ -154,9 +164,11 @@ class PickupSpawner:
         top_y = platform.stand_rect.top
         left = platform.rect.left
         right = platform.rect.right
+        # Pickups resting on the stand line cover the pixel row just above it.
+        area = pygame.Rect(left, top_y - 1, right - left + 1, 1)
 
         for group in (self._banana_pickups, self._health_pickups):
-            for sprite in group.sprites():
+            for sprite in group.near(area):
                 if sprite.rect.bottom != top_y:
                     continue
                 cx = sprite.rect.centerx
@@ -165,18 +177,13 @@ class PickupSpawner:
         return False
 
     @staticmethod
-    def _non_overlapping(rect: pygame.Rect, groups: Iterable[pygame.sprite.Group]) -> bool:
-        for group in groups:
-            for sprite in group.sprites():
-                if rect.colliderect(sprite.rect):
-                    return False
-        return True
+    def _non_overlapping(rect: pygame.Rect, groups: Iterable[IndexedGroup]) -> bool:
+        return not any(group.colliding(rect) for group in groups)
 
-    @staticmethod
-    def _random_x_on_platform(platform: Platform) -> int:
+    def _random_x_on_platform(self, platform: Platform) -> int:
         left = platform.rect.left + 20
         right = platform.rect.right - 20
-        return randint(left, right)
+        return self._rng.randint(left, right)
 
 
 __all__ = ["PickupSpawner"]
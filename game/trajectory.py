@@ -1,9 +1,219 @@
-"""Utility helpers for generating projectile trajectories for debug rendering."""
+"""Closed-form projectile trajectories for path previews.
+
+A projectile moves by its velocity each tick, then gains ``gravity *
+gravity_scale`` of downward speed, capped at ``max_fall``. Summed over ``n``
+ticks that gives a parabola until the cap is reached and a straight line
+after it, so any tick's position and the tick the path leaves the play area
+can be found without stepping. These follow a point; where an actual
+banana or hook meets the level comes from ``GameWorld.predict_impact``.
+"""
 from __future__ import annotations
 
-from typing import Iterable
+import math
+from typing import Iterable, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 import pygame
 
+
+class Crossing(NamedTuple):
+    """Where a throw first meets the level: a platform, the ground or the ceiling."""
+
+    tick: int  # the tick whose move reaches the surface
+    point: tuple[float, float]
+    platform: pygame.sprite.Sprite | None  # None for the ground (or the ceiling, for hooks)
+
+
+class Trajectory:
+    """The arc followed from ``start`` with ``velocity``, tick by tick.
+
+    ``position(n)`` is where the projectile is after ``n`` ticks and matches
+    stepping the motion ``n`` times up to float rounding. Gravity must not
+    point upwards.
+    """
+
+    __slots__ = ("x0", "y0", "vx", "vy", "accel", "max_fall", "clamp_tick", "_clamp_y")
+
+    def __init__(
+        self,
+        start: Iterable[float],
+        velocity: Iterable[float],
+        *,
+        gravity: float,
+        gravity_scale: float = 1.0,
+        max_fall: float | None = None,
+    ) -> None:
+        self.x0, self.y0 = (float(value) for value in start)
+        self.vx, self.vy = (float(value) for value in velocity)
+        self.accel = gravity * gravity_scale
+        if self.accel < 0:
+            raise ValueError("trajectory gravity must not point upwards")
+        self.max_fall = max_fall
+        # First tick that moves at the capped speed (the launch speed itself is never capped).
+        self.clamp_tick: int | None = None
+        if max_fall is not None:
+            if self.vy + self.accel > max_fall:
+                self.clamp_tick = 1
+            elif self.accel > 0:
+                tick = max(1, math.floor((max_fall - self.vy) / self.accel) + 1)
+                while tick > 1 and self.vy + (tick - 1) * self.accel > max_fall:
+                    tick -= 1
+                while self.vy + tick * self.accel <= max_fall:
+                    tick += 1
+                self.clamp_tick = tick
+        self._clamp_y = self._parabola_y(self.clamp_tick) if self.clamp_tick is not None else 0.0
+
+    # ------------------------------------------------------------------
+    # Positions
+    # ------------------------------------------------------------------
+    def _parabola_y(self, n: float) -> float:
+        return self.y0 + n * self.vy + self.accel * n * (n - 1) / 2
+
+    def x_at(self, n: int) -> float:
+        return self.x0 + n * self.vx
+
+    def y_at(self, n: int) -> float:
+        clamp = self.clamp_tick
+        if clamp is None or n <= clamp:
+            return self._parabola_y(n)
+        return self._clamp_y + (n - clamp) * self.max_fall
+
+    def position(self, n: int) -> tuple[float, float]:
+        return self.x_at(n), self.y_at(n)
+
+    def sample(self, ticks: Iterable[int]) -> list[tuple[float, float]]:
+        """Positions after each of ``ticks``."""
+        return [self.position(n) for n in ticks]
+
+    def points(self, count: int) -> list[tuple[int, int]]:
+        """Integer positions after ticks ``1..count``, truncated like ``int()``."""
+        x0, y0, vx, vy, half = self.x0, self.y0, self.vx, self.vy, self.accel / 2
+        clamp = self.clamp_tick
+        curve_end = count if clamp is None else min(count, clamp)
+        points = [(int(x0 + n * vx), int(y0 + n * vy + half * n * (n - 1))) for n in range(1, curve_end + 1)]
+        if curve_end < count:
+            clamp_y, fall = self._clamp_y, self.max_fall
+            points += [
+                (int(x0 + n * vx), int(clamp_y + (n - clamp) * fall)) for n in range(curve_end + 1, count + 1)
+            ]
+        return points
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+    def tick_reaching(self, level: float, after: int = 0) -> int | None:
+        """First tick ``n > after`` at which ``y >= level`` (screen y grows downwards)."""
+        first = after + 1
+        if self.y_at(first) >= level:
+            return first
+        # Past ``first`` the path is convex, so it is below ``level`` until a single crossing.
+        clamp = self.clamp_tick
+        accel = self.accel
+        if clamp is not None and self._clamp_y < level:
+            # Reached on the straight part.
+            if self.max_fall <= 0:
+                return None
+            guess = clamp + math.ceil((level - self._clamp_y) / self.max_fall)
+        elif accel > 0:
+            # Larger root of accel/2 n^2 + (vy - accel/2) n + (y0 - level) = 0.
+            b = self.vy - accel / 2
+            disc = b * b - 2 * accel * (self.y0 - level)
+            guess = math.ceil((-b + math.sqrt(max(disc, 0.0))) / accel)
+        elif clamp is not None:
+            guess = clamp
+        elif self.vy > 0:
+            guess = math.ceil((level - self.y0) / self.vy)
+        else:
+            return None
+        return self._settle(max(guess, first), first, lambda n: self.y_at(n) >= level)
+
+    def exit_tick(self, ground_y: float, screen_width: float) -> int | None:
+        """First tick at which the path is at or below ``ground_y`` or off either screen edge."""
+        ground = self.tick_reaching(ground_y)
+        side = self.side_exit_tick(0, screen_width)
+        if ground is None:
+            return side
+        if side is None:
+            return ground
+        return min(ground, side)
+
+    def side_exit_tick(self, left: float, right: float) -> int | None:
+        """First tick at which ``x < left`` or ``x > right``."""
+        def outside(n: int) -> bool:
+            x = self.x_at(n)
+            return x < left or x > right
+
+        if outside(1):
+            return 1
+        if self.vx < 0:
+            guess = math.floor((left - self.x0) / self.vx) + 1
+        elif self.vx > 0:
+            guess = math.floor((right - self.x0) / self.vx) + 1
+        else:
+            return None
+        return self._settle(max(guess, 1), 1, outside)
+
+    @staticmethod
+    def _settle(guess: int, first: int, reached) -> int:
+        """Nudge a rounded analytic estimate onto the first tick where ``reached`` holds."""
+        tick = guess
+        while tick > first and reached(tick - 1):
+            tick -= 1
+        while not reached(tick):
+            tick += 1
+        return tick
+
+
+class PathTemplate:
+    """A path launched from the origin, translated and clipped wherever it is drawn.
+
+    The shape of an arc depends only on its launch velocity, so previews for
+    a given aim can share one template. ``points`` gives what
+    ``simulate_trajectory`` would for the same throw from ``start``; the last
+    list is kept and handed out again while the start does not move, so
+    callers must not modify it.
+    """
+
+    __slots__ = ("path", "steps", "_offsets", "_last_key", "_last_points")
+
+    def __init__(
+        self,
+        velocity: Iterable[float],
+        *,
+        gravity: float,
+        gravity_scale: float,
+        max_fall: float | None,
+        steps: int,
+    ) -> None:
+        self.path = Trajectory((0, 0), velocity, gravity=gravity, gravity_scale=gravity_scale, max_fall=max_fall)
+        self.steps = steps
+        self._offsets = self.path.sample(range(1, steps + 1))
+        self._last_key: tuple[int, int, int, int] | None = None
+        self._last_points: list[tuple[int, int]] = []
+
+    def points(self, start: tuple[int, int], ground_y: int, screen_width: int) -> list[tuple[int, int]]:
+        """Integer path points for a throw from the integer position ``start``."""
+        x, y = start
+        key = (x, y, ground_y, screen_width)
+        if key == self._last_key:
+            return self._last_points
+        path = self.path
+        end = self.steps
+        ground = path.tick_reaching(ground_y - y)
+        if ground is not None and ground < end:
+            end = ground
+        side = path.side_exit_tick(-x, screen_width - x)
+        if side is not None and side < end:
+            end = side
+        points = [(int(x + dx), int(y + dy)) for dx, dy in self._offsets[:end]]
+        self._last_key, self._last_points = key, points
+        return points
+
+
 def simulate_trajectory(
     start: Iterable[float],
     velocity: pygame.Vector2,
@@ -16,17 +226,60 @@ def simulate_trajectory(
     screen_width: int,
 ) -> list[tuple[int, int]]:
     """Return a list of integer coordinate points approximating a projectile arc."""
-    pos = pygame.Vector2(start)
-    vel = pygame.Vector2(velocity)
-    points: list[tuple[int, int]] = []
-
-    for _ in range(steps):
-        pos += vel
-        vel.y += gravity * gravity_scale
-        if max_fall is not None and vel.y > max_fall:
-            vel.y = max_fall
-        points.append((int(pos.x), int(pos.y)))
-        if pos.y >= ground_y or pos.x < 0 or pos.x > screen_width:
-            break
-
-    return points
+    path = Trajectory(start, velocity, gravity=gravity, gravity_scale=gravity_scale, max_fall=max_fall)
+    end = path.exit_tick(ground_y, screen_width)
+    count = steps if end is None else min(steps, end)
+    return path.points(count)
+
+
+def simulate_trajectories(
+    starts,
+    velocities,
+    gravity_scales,
+    *,
+    gravity: float,
+    max_fall: float | None,
+    steps: int,
+    ground_y: int,
+    screen_width: int,
+):
+    """Evaluate many throws at once with NumPy.
+
+    ``starts`` and ``velocities`` are ``(paths, 2)`` array-likes and
+    ``gravity_scales`` is a scalar or one value per path. Returns
+    ``(points, ends)``: ``points`` is a ``(paths, steps, 2)`` float array of
+    positions after ticks ``1..steps`` and ``points[i, :ends[i]]`` is what
+    ``simulate_trajectory`` gives for path ``i`` (before its ``int()``
+    truncation). Positions past a path's end are still filled in.
+    """
+    if np is None:
+        raise RuntimeError("batch trajectory evaluation needs NumPy")
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    velocities = np.asarray(velocities, dtype=float).reshape(-1, 2)
+    count = len(starts)
+    accel = np.broadcast_to(np.asarray(gravity_scales, dtype=float) * gravity, (count,))[:, None]
+    if (accel < 0).any():
+        raise ValueError("trajectory gravity must not point upwards")
+    x0, y0 = starts[:, :1], starts[:, 1:]
+    vx, vy = velocities[:, :1], velocities[:, 1:]
+    ticks = np.arange(1, steps + 1, dtype=float)[None, :]
+
+    x = x0 + ticks * vx
+    y = y0 + ticks * vy + accel * ticks * (ticks - 1) / 2
+    if max_fall is not None:
+        # First tick moving at the capped speed, as in ``Trajectory``; past ``steps`` when it never is.
+        never = float(steps + 1)
+        rising = accel > 0
+        guess = np.floor((max_fall - vy) / np.where(rising, accel, 1.0)) + 1
+        clamp = np.where(vy + accel > max_fall, 1.0, np.where(rising, np.clip(guess, 1.0, never), never))
+        clamp = np.where((clamp > 1) & (vy + (clamp - 1) * accel > max_fall), clamp - 1, clamp)
+        clamp = np.where((clamp < never) & (vy + clamp * accel <= max_fall), clamp + 1, clamp)
+        clamp_y = y0 + clamp * vy + accel * clamp * (clamp - 1) / 2
+        y = np.where(ticks <= clamp, y, clamp_y + (ticks - clamp) * max_fall)
+
+    done = (y >= ground_y) | (x < 0) | (x > screen_width)
+    ends = np.where(done.any(axis=1), done.argmax(axis=1) + 1, steps)
+    return np.stack((x, y), axis=-1), ends
+
+
+__all__ = ["Crossing", "PathTemplate", "Trajectory", "simulate_trajectories", "simulate_trajectory"]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 import pygame
 
+from assets import derived_cache_stats
 from constants import (
     COLOR_BG,
     COLOR_TITLE,
@@ -26,8 +27,9 @@ from constants import (
 from sprites.hero import Hero
 from sprites.banana import Banana
 
+from .profiler import NULL_PROFILER, PhaseProfiler
 from .resources import GameResources
-from .trajectory import simulate_trajectory
+from .trajectory import Crossing, PathTemplate
 from .world import GameWorld
 
 if TYPE_CHECKING:
@@ -55,6 +57,13 @@ class GameSceneRenderer:
         self._result_center = (SCREEN_WIDTH // 2, 260)
         self._restart_prompt_visible_at = 0
         self._start_bg_color = (32, 120, 70)
+        self.profiler = NULL_PROFILER
+        self._profiler_panel: pygame.Surface | None = None
+        self._profiler_panel_age = 0
+        self._aim_paths: dict[tuple[int, int, bool], tuple[PathTemplate, PathTemplate]] = {}
+        self._path_dots: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._launches: dict[tuple[int, int, bool], tuple[tuple[float, float], tuple[float, float]]] = {}
+        self._impacts: dict[tuple, tuple[Crossing | None, Crossing | None]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -129,28 +138,72 @@ class GameSceneRenderer:
     def set_restart_prompt_visible_at(self, timestamp_ms: int) -> None:
         self._restart_prompt_visible_at = timestamp_ms
 
-    def draw_gameplay(self, world: GameWorld) -> None:
+    def draw_gameplay(self, world: GameWorld, alpha: float = 1.0) -> None:
+        """Draw the arena; ``alpha`` interpolates moving sprites within the last tick."""
+        # Impact markers belong to the simulated throw origin, not the interpolated one.
+        impacts = self._predict_impacts(world)
+        with world.interpolated(alpha):
+            self._draw_gameplay(world, impacts)
+
+    def _draw_gameplay(self, world: GameWorld, impacts: list[tuple[Crossing | None, Crossing | None]]) -> None:
         res = self.resources
+        lap = self.profiler.lap
+        lap("draw.interpolate")
         self.screen.blit(res.sky, (0, 0))
         self.screen.blit(res.ground, (0, 0))
+        lap("draw.background")
 
         world.platforms.draw(self.screen)
         world.banana_pickups.draw(self.screen)
         world.health_pickups.draw(self.screen)
+        lap("draw.level")
 
         self._draw_hearts(world.players.first, left=True)
         self._draw_hearts(world.players.second, left=False)
         self._draw_inventory_icons(world)
         self._draw_hook_icons(world)
+        lap("draw.hud")
 
         world.player_group.draw(self.screen)
         self._draw_hit_stars(world)
         world.throwables.draw(self.screen)
         self._draw_name_tags(world)
         self._draw_hooks(world)
+        lap("draw.sprites")
         self._draw_aim_targets(world)
-        self._draw_trajectories(world)
+        self._draw_trajectories(world, impacts)
         self._draw_debug_boxes(world)
+        lap("draw.aim_debug")
+
+    def draw_profiler_overlay(self, profiler: PhaseProfiler, *, refresh_frames: int = 15) -> None:
+        """Show per-phase frame timings (last, p50, p95, p99 in ms) in the top-left corner.
+
+        The text is re-rendered every ``refresh_frames`` calls so the numbers stay
+        readable and the overlay itself stays cheap.
+        """
+        self._profiler_panel_age -= 1
+        if self._profiler_panel is None or self._profiler_panel_age <= 0:
+            self._profiler_panel = self._render_profiler_panel(profiler)
+            self._profiler_panel_age = refresh_frames
+        self.screen.blit(self._profiler_panel, (12, 90))
+
+    def _render_profiler_panel(self, profiler: PhaseProfiler) -> pygame.Surface:
+        font = self.resources.debug_font
+        lines = [("phase", "last", "p50", "p95", "p99")]
+        for phase, last, (p50, p95, p99) in profiler.stats():
+            lines.append((phase, f"{last:.2f}", f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+        cache = derived_cache_stats()
+        lines.append((f"asset cache {cache['hits']} hit / {cache['misses']} miss",))
+
+        columns = (0, 235, 295, 355, 415)
+        line_height = font.get_linesize()
+        panel = pygame.Surface((475, line_height * len(lines) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for row, cells in enumerate(lines):
+            color = self._title_color if row == 0 else self._muted_color
+            for x_pos, text in zip(columns, cells):
+                panel.blit(font.render(text, False, color), (8 + x_pos, 6 + row * line_height))
+        return panel
 
     def draw_pause_overlay(self, *, test_mode: bool) -> None:
         self.screen.blit(self._overlay_surface, (0, 0))
@@ -342,7 +395,7 @@ class GameSceneRenderer:
         banana_w = res.banana_icon.get_width()
         heart_height = res.heart.get_height()
         y_pos = pad + heart_height + 8
-        now = pygame.time.get_ticks()
+        now = world.clock.now()
 
         player1 = world.players.first
         if (not player1.hook_active) and (now >= player1.hook_ready_time):
@@ -413,7 +466,7 @@ class GameSceneRenderer:
         frames = getattr(self.resources, "hit_stars_frames", ())
         if not frames:
             return
-        now = pygame.time.get_ticks()
+        now = world.clock.now()
         for hero in world.players:
             start = getattr(hero, "hit_stars_start", 0)
             end = getattr(hero, "hit_stars_until", 0)
@@ -427,52 +480,110 @@ class GameSceneRenderer:
             rect = sprite.get_rect(midtop=(hero.rect.centerx + 6, hero.rect.top + 3))
             self.screen.blit(sprite, rect)
 
-    def _draw_trajectories(self, world: GameWorld) -> None:
+    def _predict_impacts(self, world: GameWorld) -> list[tuple[Crossing | None, Crossing | None]]:
+        """Banana and hook impact points for each hero's current aim (test mode only)."""
         if not world.is_test_mode:
-            return
+            return []
 
+        impacts = []
         for player in world.players:
-            start = pygame.Vector2(player.rect.center)
-            aim_dir = player._aim_direction()
+            start = player.rect.center
+            tx, ty = player.get_aim_pos()
+            aim = (tx - start[0], ty - start[1], player.facing_right)
+            # Impacts only change when the hero moves, re-aims or the level does.
+            key = (aim, start, id(world.platforms), world.platforms.version)
+            pair = self._impacts.get(key)
+            if pair is None:
+                if len(self._impacts) > 64:
+                    self._impacts.clear()
+                if aim not in self._launches:
+                    self._build_aim_paths(aim)
+                banana_launch, hook_launch = self._launches[aim]
+                pair = self._impacts[key] = (
+                    world.predict_impact(start, banana_launch, thrower=player),
+                    world.predict_impact(start, hook_launch, hook=True, thrower=player),
+                )
+            impacts.append(pair)
+        return impacts
+
+    def _draw_trajectories(self, world: GameWorld, impacts: list[tuple[Crossing | None, Crossing | None]]) -> None:
+        if not world.is_test_mode:
+            return
 
-            launch_vec = pygame.Vector2(aim_dir.x, aim_dir.y - 0.35)
-            if launch_vec.length_squared() == 0:
-                launch_vec = aim_dir
-            else:
-                launch_vec = launch_vec.normalize()
-
-            banana_velocity = launch_vec * BANANA_THROW_SPEED
-            banana_velocity.y += PROJECTILE_GRAVITY
-            banana_path = simulate_trajectory(
-                start,
-                banana_velocity,
-                gravity=PROJECTILE_GRAVITY,
-                gravity_scale=1.0,
-                max_fall=MAX_PROJECTILE_FALL_SPEED,
-                steps=90,
-                ground_y=GROUND_Y,
-                screen_width=SCREEN_WIDTH,
-            )
-            self._plot_path(banana_path, color=(250, 220, 90))
-
-            hook_velocity = aim_dir * (HOOK_THROW_BASE_SPEED * HOOK_THROW_SPEED_MULTIPLIER)
-            hook_path = simulate_trajectory(
-                start,
-                hook_velocity,
-                gravity=PROJECTILE_GRAVITY,
-                gravity_scale=0.5,
-                max_fall=MAX_PROJECTILE_FALL_SPEED,
-                steps=90,
-                ground_y=GROUND_Y,
-                screen_width=SCREEN_WIDTH,
-            )
-            self._plot_path(hook_path, color=(180, 230, 255))
+        for player, (banana_impact, hook_impact) in zip(world.players, impacts):
+            start = player.rect.center
+            tx, ty = player.get_aim_pos()
+            aim = (tx - start[0], ty - start[1], player.facing_right)
+            banana_path, hook_path = self._aim_paths.get(aim) or self._build_aim_paths(aim)
+            self._plot_path(banana_path.points(start, GROUND_Y, SCREEN_WIDTH), color=(250, 220, 90))
+            self._plot_path(hook_path.points(start, GROUND_Y, SCREEN_WIDTH), color=(180, 230, 255))
+            if banana_impact is not None:
+                self._draw_impact_marker(banana_impact.point, (250, 220, 90))
+            if hook_impact is not None:
+                self._draw_impact_marker(hook_impact.point, (180, 230, 255))
+
+    def _build_aim_paths(self, aim: tuple[int, int, bool]) -> tuple[PathTemplate, PathTemplate]:
+        """Banana and hook path templates for a reticle offset, cached for later frames.
+
+        Heroes aim through an integer reticle offset, which fixes the launch
+        velocities (these follow ``Hero``'s throw and hook code), so a small
+        set of offsets covers every preview.
+        """
+        dx, dy, facing_right = aim
+        aim_dir = pygame.Vector2(dx, dy)
+        if aim_dir.length_squared() == 0:
+            aim_dir = pygame.Vector2(1 if facing_right else -1, 0)
+        else:
+            aim_dir = aim_dir.normalize()
+
+        launch_vec = pygame.Vector2(aim_dir.x, aim_dir.y - 0.35)
+        if launch_vec.length_squared() == 0:
+            launch_vec = aim_dir
+        else:
+            launch_vec = launch_vec.normalize()
+
+        banana_velocity = launch_vec * BANANA_THROW_SPEED
+        hook_velocity = aim_dir * (HOOK_THROW_BASE_SPEED * HOOK_THROW_SPEED_MULTIPLIER)
+        self._launches[aim] = (tuple(banana_velocity), tuple(hook_velocity))
+
+        # Templates move before falling, projectiles fall first: fold in the first tick's gravity.
+        banana_velocity.y += PROJECTILE_GRAVITY
+        banana_path = PathTemplate(
+            banana_velocity,
+            gravity=PROJECTILE_GRAVITY,
+            gravity_scale=1.0,
+            max_fall=MAX_PROJECTILE_FALL_SPEED,
+            steps=90,
+        )
+        hook_velocity.y += PROJECTILE_GRAVITY * 0.5
+        hook_path = PathTemplate(
+            hook_velocity,
+            gravity=PROJECTILE_GRAVITY,
+            gravity_scale=0.5,
+            max_fall=MAX_PROJECTILE_FALL_SPEED,
+            steps=90,
+        )
+        paths = self._aim_paths[aim] = (banana_path, hook_path)
+        return paths
+
+    def _draw_impact_marker(self, point: tuple[float, float], color: tuple[int, int, int]) -> None:
+        x, y = round(point[0]), round(point[1])
+        pygame.draw.circle(self.screen, color, (x, y), 6, 2)
+        pygame.draw.line(self.screen, color, (x - 3, y), (x + 3, y))
+        pygame.draw.line(self.screen, color, (x, y - 3), (x, y + 3))
 
     def _plot_path(self, points: list[tuple[int, int]], color: tuple[int, int, int]) -> None:
         if len(points) < 2:
             return
-        for pt in points:
-            pygame.draw.circle(self.screen, color, pt, 2)
+        dot = self._path_dots.get(color)
+        if dot is None:
+            # Same pixels as pygame.draw.circle(..., radius=2), blitted in one batch.
+            dot = pygame.Surface((5, 5))
+            dot.set_colorkey((0, 0, 0) if color != (0, 0, 0) else (255, 255, 255))
+            dot.fill(dot.get_colorkey())
+            pygame.draw.circle(dot, color, (2, 2), 2)
+            self._path_dots[color] = dot
+        self.screen.blits([(dot, (x - 2, y - 2)) for x, y in points], False)
 
 
 __all__ = ["GameSceneRenderer"]
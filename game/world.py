@@ -1,16 +1,79 @@
 """GameWorld aggregates mutable runtime state and mediates cross-system interactions."""
 from __future__ import annotations
 
+import random
+import zlib
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Iterator, Tuple
+from typing import Callable, Iterable, Iterator, Tuple
 
 import pygame
 
-from constants import MAX_HEALTH, SCREEN_WIDTH, GROUND_Y
+from constants import (
+    BANANA_SPAWN_INTERVAL_MS,
+    GROUND_Y,
+    HEART_SPAWN_INTERVAL_MS,
+    MAX_HEALTH,
+    REGEN_INTERVAL_MS,
+    SCREEN_WIDTH,
+)
+from inputframe import IDLE_FRAME, InputFrame
 from keymap import load_controls
-from sprites import Hero
-from sprites.banana import Banana
+from simclock import SimClock
+from assets import get_floor_images
+from sprites import Hero, Sling
+from sprites.banana import Banana, BananaPickup
+from sprites.health import HealthPickup
+from sprites.platform import Platform
+from sprites.collision import sweep_rect_toi
+from sprites.spatial import IndexedGroup, StandLineIndex
+from .pool import ProjectilePool
+from .profiler import NULL_PROFILER
+from .projectile_engine import BananaEngine
 from .spawn import PickupSpawner
+from .trajectory import Crossing
+
+
+_SEED_SOURCE = random.SystemRandom()
+
+# Stable numeric codes for sprite state strings (str hashes vary per process).
+_STATE_CODES = {
+    "flying": 1,
+    "falling_after_hit": 2,
+    "splatted_persist": 3,
+    "splatted_temp": 4,
+    "attached": 5,
+    "done": 6,
+}
+
+# Row of pixels just above the floor, wide enough for splats that left the screen sideways.
+_GROUND_STRIP = pygame.Rect(-SCREEN_WIDTH, GROUND_Y - 1, 3 * SCREEN_WIDTH, 1)
+
+
+
+class _CountingRandom(random.Random):
+    """``random.Random`` that counts state changes so snapshots can reuse an unchanged state."""
+
+    def __init__(self, seed=None) -> None:
+        self.draws = 0
+        super().__init__(seed)
+
+    def seed(self, *args, **kwargs) -> None:
+        self.draws = getattr(self, "draws", 0) + 1
+        super().seed(*args, **kwargs)
+
+    def setstate(self, state) -> None:
+        self.draws += 1
+        super().setstate(state)
+
+    def random(self) -> float:
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += 1
+        return super().getrandbits(k)
 
 
 @dataclass(slots=True)
@@ -30,15 +93,25 @@ class GameWorld:
     """Owns sprite groups, player references, and round lifecycle helpers."""
 
     _SELF_HIT_ACTIVITY_WINDOW_MS = 10000
-
-    def __init__(self, *, test_mode: bool = False) -> None:
+    _PREDICT_TICK_LIMIT = 600  # longest flight predict_impact will step
+
+    def __init__(self, *, test_mode: bool = False, vectorized_projectiles: bool = False) -> None:
+        self.clock = SimClock()
+        self.profiler = NULL_PROFILER  # Game swaps in a PhaseProfiler to time update phases
+        self.rng: random.Random = _CountingRandom()
+        self._rng_snapshot: tuple | None = None
+        self._rng_snapshot_draws = -1
+        self.round_seed: int | None = None
         self.players = Players(*self._create_players())
         self.player_group = pygame.sprite.Group(*self.players.as_tuple())
         self.throwables = pygame.sprite.Group()
         self.hooks = pygame.sprite.Group()
-        self.banana_pickups = pygame.sprite.Group()
-        self.health_pickups = pygame.sprite.Group()
-        self.platforms = pygame.sprite.Group()
+        # Static sprites live in spatially indexed groups so collision queries stay local.
+        self.banana_pickups = IndexedGroup()
+        self.health_pickups = IndexedGroup()
+        self.platforms = IndexedGroup()
+        # Persistent splats (a subset of ``throwables``); bananas join and leave it themselves.
+        self.splats = IndexedGroup()
 
         self.test_mode = bool(test_mode)
 
@@ -47,14 +120,35 @@ class GameWorld:
             banana_pickups=self.banana_pickups,
             health_pickups=self.health_pickups,
             players=self.players,
+            rng=self.rng,
         )
 
         for hero in self.players:
             hero.world = self
+            hero.clock = self.clock
+        # Heroes draw bananas and hooks from here instead of constructing them per throw.
+        self.projectile_pool = ProjectilePool(self.clock, self.players)
+        # Optional NumPy stepping of flying bananas (see game.projectile_engine).
+        self.projectile_engine = BananaEngine() if vectorized_projectiles else None
+
+        self._next_banana_spawn_ms = BANANA_SPAWN_INTERVAL_MS
+        self._next_heart_spawn_ms = HEART_SPAWN_INTERVAL_MS
+        self._next_regen_ms = REGEN_INTERVAL_MS
 
         self._apply_test_mode_to_players()
         self.on_self_banana_hit: Callable[[Hero], None] | None = None
 
+        self._platform_snapshot: tuple | None = None
+        self._stand_lines = StandLineIndex()
+        self._stand_lines_version = -1
+        # predict_impact's probes run on their own clock, built on first use.
+        self._probe_clock = SimClock()
+        self._banana_probe: Banana | None = None
+        self._hook_probe: Sling | None = None
+
+        # Sprite centers before the most recent update, used for render interpolation.
+        self._previous_centers: dict[pygame.sprite.Sprite, tuple[int, int]] = {}
+
     @property
     def player1(self) -> Hero:
         return self.players.first
@@ -66,27 +160,322 @@ class GameWorld:
     # ------------------------------------------------------------------
     # Lifecycle helpers
     # ------------------------------------------------------------------
-    def begin_round(self) -> None:
+    def begin_round(self, seed: int | None = None) -> None:
+        """Reset players and pickups for a new round.
+
+        ``seed`` fixes the platform/pickup layout; a fresh one is drawn when omitted
+        and is available afterwards as ``round_seed``.
+        """
+        if seed is None:
+            seed = _SEED_SOURCE.getrandbits(32)
+        self.round_seed = seed
+        self.rng.seed(seed)
+        self.clock.reset()
+        self._next_banana_spawn_ms = BANANA_SPAWN_INTERVAL_MS
+        self._next_heart_spawn_ms = HEART_SPAWN_INTERVAL_MS
+        self._next_regen_ms = REGEN_INTERVAL_MS
         self._apply_test_mode_to_players()
+        self._previous_centers.clear()
+        self._platform_snapshot = None
         for player in self.players:
             player.reset()
         self.banana_pickups.empty()
         self.health_pickups.empty()
         self.throwables.empty()
+        self.splats.empty()
         self.hooks.empty()
         self.spawner.spawn_platforms()
         self.spawner.spawn_banana_if_needed()
 
-    def update(self) -> None:
-        self.player_group.update(self.throwables, self.hooks, self.platforms)
-        self.throwables.update(self.platforms)
+    def update(self, inputs: InputFrame = IDLE_FRAME) -> None:
+        """Advance the world one tick.
+
+        ``inputs`` supplies each player's action bitmask (see ``keymap.ACTIONS``);
+        Game builds it from the event queue, replays and bots supply their own.
+        """
+        lap = self.profiler.lap
+        self._capture_previous_centers()
+        self.clock.advance()
+        self._run_timers()
+        lap("world.timers")
+
+        for player, actions in zip(self.players, inputs):
+            player.update(self.throwables, self.hooks, self.platforms, actions)
+        lap("world.heroes")
+        if self.projectile_engine is not None:
+            self.projectile_engine.step(self.throwables, self.platforms)
+        else:
+            self.throwables.update(self.platforms)
         self.hooks.update(self.platforms)
+        lap("world.projectiles")
         self.banana_pickups.update()
         self.health_pickups.update()
+        lap("world.pickups")
 
         self._collect_pickups()
+        lap("world.collect_pickups")
         self._handle_projectile_hits()
+        lap("world.projectile_hits")
         self._handle_splats()
+        lap("world.splats")
+
+    @contextmanager
+    def interpolated(self, alpha: float) -> Iterator[None]:
+        """Temporarily place moving sprites ``alpha`` of the way through the last tick.
+
+        Heroes, projectiles, and hooks are moved between the centers captured
+        before the most recent update and their current centers, then restored
+        when the block exits so gameplay state is never affected by rendering.
+        """
+        if alpha >= 1.0 or not self._previous_centers:
+            yield
+            return
+
+        alpha = max(0.0, alpha)
+        moved: list[tuple[pygame.sprite.Sprite, tuple[int, int]]] = []
+        for sprite in self._interpolated_sprites():
+            prev = self._previous_centers.get(sprite)
+            if prev is None:
+                continue
+            current = sprite.rect.center
+            sprite.rect.center = (
+                round(prev[0] + (current[0] - prev[0]) * alpha),
+                round(prev[1] + (current[1] - prev[1]) * alpha),
+            )
+            moved.append((sprite, current))
+        try:
+            yield
+        finally:
+            for sprite, current in moved:
+                sprite.rect.center = current
+
+    # ------------------------------------------------------------------
+    # Snapshots (rollback, lookahead, replay keyframes)
+    # ------------------------------------------------------------------
+    def snapshot(self) -> tuple:
+        """Capture all mutable gameplay state as a flat tuple.
+
+        Sprite entries are ``(sprite, *data)``: the live object is kept so
+        ``restore`` can reuse it instead of rebuilding surfaces, while the
+        trailing plain values are enough to reconstruct it (see ``export_state``).
+        """
+        players = self.players.as_tuple()
+        hooks = self.hooks.sprites()
+        if self._platform_snapshot is None:
+            self._platform_snapshot = tuple(
+                (p, p.rect.centerx, p.rect.top, p.variant) for p in self.platforms.sprites()
+            )
+        if self.rng.draws != self._rng_snapshot_draws:
+            self._rng_snapshot = self.rng.getstate()
+            self._rng_snapshot_draws = self.rng.draws
+        return (
+            self.clock.ticks,
+            self._rng_snapshot,
+            self.round_seed,
+            self.test_mode,
+            self._next_banana_spawn_ms,
+            self._next_heart_spawn_ms,
+            self._next_regen_ms,
+            self.spawner.get_counters(),
+            self._platform_snapshot,
+            tuple((p, *p.rect.midbottom) for p in self.banana_pickups.sprites()),
+            tuple((p, *p.rect.midbottom) for p in self.health_pickups.sprites()),
+            tuple(
+                (hero, hooks.index(hero.hook_sprite) if hero.hook_sprite in hooks else -1, hero.snapshot())
+                for hero in players
+            ),
+            tuple((b, _player_index(players, b.owner), b.snapshot()) for b in self.throwables.sprites()),
+            tuple((h, _player_index(players, h.owner), h.snapshot()) for h in hooks),
+        )
+
+    def restore(self, snap) -> None:
+        """Return the world to a ``snapshot`` (or decoded ``export_state``) state."""
+        (
+            ticks, rng_state, round_seed, test_mode,
+            next_banana, next_heart, next_regen, spawner_counters,
+            platforms, banana_pickups, health_pickups, heroes, bananas, hooks,
+        ) = snap
+        players = self.players.as_tuple()
+
+        self.clock.ticks = ticks
+        # Skip the costly setstate when the generator has not moved since this state was taken.
+        if rng_state is not self._rng_snapshot or self.rng.draws != self._rng_snapshot_draws:
+            if not isinstance(rng_state, tuple):
+                version, internal, gauss_next = rng_state
+                rng_state = (version, tuple(internal), gauss_next)
+            self.rng.setstate(rng_state)
+            self._rng_snapshot = rng_state
+            self._rng_snapshot_draws = self.rng.draws
+        self.round_seed = round_seed
+        self.test_mode = bool(test_mode)
+        self._next_banana_spawn_ms = next_banana
+        self._next_heart_spawn_ms = next_heart
+        self._next_regen_ms = next_regen
+        self.spawner.set_counters(tuple(spawner_counters))
+        self._previous_centers.clear()
+
+        if platforms is not self._platform_snapshot:
+            self.platforms.empty()
+            floor_imgs = get_floor_images() if any(e[0] is None for e in platforms) else ()
+            for sprite, center_x, top, variant in platforms:
+                if sprite is None:
+                    sprite = Platform(floor_imgs[variant], midtop=(center_x, top), variant=variant)
+                self.platforms.add(sprite)
+            self._platform_snapshot = None
+
+        _refill(self.banana_pickups, [
+            sprite if sprite is not None else BananaPickup(x_pos, y_bottom=y_bottom)
+            for sprite, x_pos, y_bottom in banana_pickups
+        ])
+        _refill(self.health_pickups, [
+            sprite if sprite is not None else HealthPickup(x_pos, y_bottom=y_bottom)
+            for sprite, x_pos, y_bottom in health_pickups
+        ])
+
+        self.throwables.empty()
+        splats: list[Banana] = []
+        for sprite, owner_idx, data in bananas:
+            owner = players[owner_idx] if owner_idx >= 0 else None
+            if sprite is None:
+                sprite = self.projectile_pool.banana((0, 0), (0, 0), owner)
+            sprite.owner = owner
+            sprite.restore(data)
+            self.throwables.add(sprite)
+            if sprite.state == "splatted_persist":
+                splats.append(sprite)
+        _refill(self.splats, splats)
+
+        self.hooks.empty()
+        restored_hooks: list[Sling] = []
+        for sprite, owner_idx, data in hooks:
+            owner = players[owner_idx] if owner_idx >= 0 else None
+            if sprite is None:
+                sprite = self.projectile_pool.sling((0, 0), (0, 0), owner)
+            sprite.owner = owner
+            sprite.restore(data)
+            restored_hooks.append(sprite)
+            self.hooks.add(sprite)
+
+        for hero, (_, hook_idx, data) in zip(players, heroes):
+            hero.restore(data)
+            hero.hook_sprite = restored_hooks[hook_idx] if hook_idx >= 0 else None
+
+    def checksum(self) -> int:
+        """Return a CRC32 of the gameplay state, stable across processes and runs.
+
+        Covers hero rects, velocities, health and hook state, projectile and
+        hook states, and pickup positions, in group order. Two worlds that
+        report the same checksum every tick have not diverged.
+        """
+        values = array("d")
+        push = values.extend
+        for hero in self.players:
+            rect = hero.rect
+            push((
+                rect.x, rect.y, rect.w, rect.h,
+                hero.gravity, hero.speed, hero._hook_momentum_x, hero._hook_momentum_remainder,
+                hero.health, hero.aim_angle, hero.has_banana, hero.hook_active, hero.hook_ready_time,
+            ))
+        push((len(self.throwables), len(self.hooks), len(self.banana_pickups), len(self.health_pickups)))
+        for banana in self.throwables.sprites():
+            rect = banana.rect
+            push((rect.x, rect.y, rect.w, rect.h, banana.velocity.x, banana.velocity.y,
+                  _STATE_CODES.get(banana.state, 0)))
+        for hook in self.hooks.sprites():
+            rect = hook.rect
+            push((rect.x, rect.y, hook.velocity.x, hook.velocity.y, _STATE_CODES.get(hook.state, 0),
+                  hook.theta, hook.omega, hook.rope_len or 0.0))
+        for pickup in self.banana_pickups.sprites():
+            push(pickup.rect.midbottom)
+        for pickup in self.health_pickups.sprites():
+            push(pickup.rect.midbottom)
+        return zlib.crc32(values)
+
+    def export_state(self) -> list:
+        """Return ``snapshot()`` with live sprite references stripped, ready for JSON."""
+        snap = list(self.snapshot())
+        for idx in range(8, len(snap)):
+            snap[idx] = [(None, *entry[1:]) for entry in snap[idx]]
+        return snap
+
+    def import_state(self, state) -> None:
+        """Rebuild the world from ``export_state`` output, constructing fresh sprites."""
+        self.restore(state)
+
+    # ------------------------------------------------------------------
+    # Level geometry queries
+    # ------------------------------------------------------------------
+    def first_surface_crossed(self, x_span: tuple[int, int], y0: int, y1: int) -> Platform | None:
+        """Return the first platform met moving down from ``y0`` to ``y1`` under ``x_span``.
+
+        That is the platform with the highest stand line in ``[y0, y1]`` whose
+        stand rect overlaps ``x_span`` (``(left, right)``, right exclusive).
+        """
+        lines = self._stand_line_index().crossed(x_span, y0, y1)
+        return lines[0] if lines else None
+
+    def surfaces_crossed(self, x_span: tuple[int, int], y0: int, y1: int) -> list[Platform]:
+        """Return every platform ``first_surface_crossed`` considers, highest first."""
+        return self._stand_line_index().crossed(x_span, y0, y1)
+
+    def surfaces_overlapping(self, rect: pygame.Rect) -> list[Platform]:
+        """Return the platforms whose stand rect overlaps ``rect``, in group order."""
+        return self._stand_line_index().overlapping(rect)
+
+    def predict_impact(
+        self,
+        start: tuple[int, int],
+        velocity: Iterable[float],
+        *,
+        hook: bool = False,
+        thrower: Hero | None = None,
+    ) -> Crossing | None:
+        """Where a banana (or a hook, with ``hook=True``) thrown from ``start`` first meets the level.
+
+        Flies a ``ProjectilePool.probe`` sprite, so the answer includes the
+        rect's extent and per-tick pixel rounding. The point is the landed
+        banana's bottom centre or the hook's rope anchor; ``None`` if it
+        leaves the screen.
+        """
+        clock = self._probe_clock
+        clock.reset()
+        probe = self._projectile_probe(hook)
+        # The thrower only settles which way a straight-up hook faces.
+        probe.reset(start, velocity, thrower)
+        platforms = self.platforms
+        caught = None
+        for tick in range(1, self._PREDICT_TICK_LIMIT + 1):
+            caught = probe.fly(clock.now(), platforms) if hook else probe.fly(platforms)
+            if caught is not None:
+                break
+            clock.advance()
+        probe.owner = None
+        if caught is None or caught == "left":
+            return None
+
+        rect = probe.rect
+        if hook:
+            platform = self.surfaces_overlapping(rect)[0] if caught == "platform" else None
+            return Crossing(tick, probe.rope_world_anchor(), platform)
+        platform = None
+        if rect.bottom != GROUND_Y:
+            # The landing test rewinds along this tick's move, so look as far back.
+            reach = abs(round(probe.velocity.x)) + 1
+            for candidate in self.surfaces_crossed((rect.left - reach, rect.right + reach), rect.bottom, rect.bottom):
+                if candidate.stand_rect.top == rect.bottom:
+                    platform = candidate
+                    break
+        return Crossing(tick, (rect.centerx, rect.bottom), platform)
+
+    def _projectile_probe(self, hook: bool) -> Banana | Sling:
+        probe = self._hook_probe if hook else self._banana_probe
+        if probe is None:
+            probe = self.projectile_pool.probe(hook=hook, clock=self._probe_clock, level=self)
+            if hook:
+                self._hook_probe = probe
+            else:
+                self._banana_probe = probe
+        return probe
 
     def regenerate_players(self, amount: float) -> None:
         for player in self.players:
@@ -128,65 +517,155 @@ class GameWorld:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _interpolated_sprites(self) -> Iterator[pygame.sprite.Sprite]:
+        yield from self.players
+        yield from self.throwables
+        yield from self.hooks
+
+    def _stand_line_index(self) -> StandLineIndex:
+        # Platforms are static within a round; rebuild only when the group changes.
+        if self._stand_lines_version != self.platforms.version:
+            self._stand_lines = StandLineIndex(self.platforms.sprites())
+            self._stand_lines_version = self.platforms.version
+        return self._stand_lines
+
+    def _capture_previous_centers(self) -> None:
+        previous = self._previous_centers
+        previous.clear()
+        for sprite in self._interpolated_sprites():
+            previous[sprite] = sprite.rect.center
+
+    def _run_timers(self) -> None:
+        """Fire periodic spawns and regeneration on simulation-time boundaries."""
+        now = self.clock.now()
+        if now >= self._next_banana_spawn_ms:
+            self._next_banana_spawn_ms += BANANA_SPAWN_INTERVAL_MS
+            self.spawner.spawn_banana_if_needed()
+        if now >= self._next_heart_spawn_ms:
+            self._next_heart_spawn_ms += HEART_SPAWN_INTERVAL_MS
+            self.spawner.spawn_heart_if_needed()
+        if now >= self._next_regen_ms:
+            self._next_regen_ms += REGEN_INTERVAL_MS
+            self.regenerate_players(0.5)
+
     def _collect_pickups(self) -> None:
+        # The two pickup groups are independent, so one pass per hero picks up the same as two.
         for player in self.players:
-            pickup_rect = player.pickup_hitbox()
+            hitbox = player.pickup_hitbox()
             if not player.has_banana:
-                hit = next((p for p in self.banana_pickups if pickup_rect.colliderect(p.rect)), None)
-                if hit:
+                hits = self.banana_pickups.colliding(hitbox)
+                if hits:
                     player.has_banana = True
-                    hit.kill()
-
-        for player in self.players:
-            pickup_rect = player.pickup_hitbox()
-            hit = next((p for p in self.health_pickups if pickup_rect.colliderect(p.rect)), None)
-            if hit:
+                    hits[0].kill()
+            hits = self.health_pickups.colliding(hitbox)
+            if hits:
                 player.health = min(MAX_HEALTH, player.health + 1.0)
-                hit.kill()
+                hits[0].kill()
+
+    def _projectile_impact(self, projectile, targets: Iterable[Hero]) -> tuple[float, Hero] | None:
+        """Return ``(t, player)`` for the first of ``targets`` ``projectile`` met during the last tick.
+
+        Both sides moved in a straight line between their previous and current
+        centers, so the projectile is swept against each hitbox in the
+        hitbox's frame of reference.
+        """
+        previous = self._previous_centers
+        end_x, end_y = projectile.rect.center
+        start_x, start_y = previous.get(projectile, (end_x, end_y))
+        move_x, move_y = end_x - start_x, end_y - start_y
+        best: tuple[float, Hero] | None = None
+        for player in targets:
+            hero_x, hero_y = player.rect.center
+            prev_x, prev_y = previous.get(player, (hero_x, hero_y))
+            delta = (move_x - (hero_x - prev_x), move_y - (hero_y - prev_y))
+            start = projectile.rect.move(-delta[0], -delta[1])
+            toi = sweep_rect_toi(start, delta, player.banana_hitbox())
+            if toi is not None and (best is None or toi < best[0]):
+                best = (toi, player)
+        return best
+
+    def _swept_hitbox(self, player: Hero) -> pygame.Rect:
+        """``player``'s banana hitbox grown to cover where it was at the start of the tick."""
+        hitbox = player.banana_hitbox()
+        hero_x, hero_y = player.rect.center
+        prev_x, prev_y = self._previous_centers.get(player, (hero_x, hero_y))
+        return hitbox.union(hitbox.move(prev_x - hero_x, prev_y - hero_y))
 
     def _handle_projectile_hits(self) -> None:
+        if not self.throwables:
+            return
+        players = self.players.as_tuple()
+        # Only projectiles whose swept box reached a hitbox's swept box need the exact test.
+        swept = [self._swept_hitbox(player) for player in players]
+        engine = self.projectile_engine
+        if engine is not None:
+            near = engine.near(swept)
+        previous = self._previous_centers
         for projectile in self.throwables.sprites():
-            for player in self.players:
-                if not getattr(projectile, "can_hit", lambda *_: True)(player):
+            if engine is not None and projectile in engine:
+                if projectile not in near:
                     continue
-                if projectile.rect.colliderect(player.banana_hitbox()):
-                    projectile.on_hit(player)
-                    if isinstance(projectile, Banana):
-                        now = pygame.time.get_ticks()
-                        player.hit_stars_start = now
-                        player.hit_stars_until = now + 1000
-                        owner = getattr(projectile, "owner", None)
-                        if owner is player:
-                            if not self.test_mode:
-                                owner.has_self_hit = True
-                                if self.handle_banana_miss(owner):
-                                    if (
-                                        owner.missed_banana_streak >= 7
-                                        and not getattr(owner, "has_landed_direct_banana_hit", False)
-                                        and not getattr(owner, "has_self_hit", False)
-                                        and self.on_self_banana_hit
-                                    ):
-                                        self.on_self_banana_hit(player)
-                        elif isinstance(owner, Hero):
-                            if not self.test_mode:
-                                owner.register_banana_hit()
-                    break
+                reached = players
+            else:
+                rect = projectile.rect
+                end_x, end_y = rect.center
+                start_x, start_y = previous.get(projectile, (end_x, end_y))
+                bounds = rect.union(rect.move(start_x - end_x, start_y - end_y))
+                reached = [player for player, box in zip(players, swept) if bounds.colliderect(box)]
+                if not reached:
+                    continue
+            can_hit = getattr(projectile, "can_hit", None)
+            targets = reached if can_hit is None else [player for player in reached if can_hit(player)]
+            if not targets:
+                continue
+            impact = self._projectile_impact(projectile, targets)
+            if impact is not None:
+                toi, player = impact
+                if not projectile.rect.colliderect(player.banana_hitbox()):
+                    # Passed clean through: rewind to the contact point so the splat starts there.
+                    start_x, start_y = self._previous_centers.get(projectile, projectile.rect.center)
+                    end_x, end_y = projectile.rect.center
+                    projectile.rect.center = (
+                        round(start_x + (end_x - start_x) * toi),
+                        round(start_y + (end_y - start_y) * toi),
+                    )
+                projectile.on_hit(player)
+                if isinstance(projectile, Banana):
+                    now = self.clock.now()
+                    player.hit_stars_start = now
+                    player.hit_stars_until = now + 1000
+                    owner = getattr(projectile, "owner", None)
+                    if owner is player:
+                        if not self.test_mode:
+                            owner.has_self_hit = True
+                            if self.handle_banana_miss(owner):
+                                if (
+                                    owner.missed_banana_streak >= 7
+                                    and not getattr(owner, "has_landed_direct_banana_hit", False)
+                                    and not getattr(owner, "has_self_hit", False)
+                                    and self.on_self_banana_hit
+                                ):
+                                    self.on_self_banana_hit(player)
+                    elif isinstance(owner, Hero):
+                        if not self.test_mode:
+                            owner.register_banana_hit()
 
     def _handle_splats(self) -> None:
-        splats = [
-            sprite
-            for sprite in self.throwables.sprites()
-            if isinstance(sprite, Banana) and sprite.state == "splatted_persist"
-        ]
+        splats = self.splats
+        if not splats:
+            return
+
+        # Taken before stepping: a splat stepped on this tick still counts towards the cap.
+        ground_splats = [s for s in splats.near(_GROUND_STRIP) if s.rect.bottom == GROUND_Y]
 
-        for splat in splats:
+        # Splat hitboxes are inflated by (10, 6), so widen each query by the same margin.
+        pickup_rects = [player.pickup_hitbox() for player in self.players]
+        for splat in splats.near_any(rect.inflate(10, 6) for rect in pickup_rects):
             hitbox = splat.rect.inflate(10, 6)
-            for player in self.players:
-                pickup_rect = player.pickup_hitbox()
+            for player, pickup_rect in zip(self.players, pickup_rects):
                 if hitbox.colliderect(pickup_rect):
                     splat.stepped_on_by(player)
 
-        ground_splats = [s for s in splats if s.rect.bottom == GROUND_Y]
         if len(ground_splats) > 2:
             ground_splats.sort(key=lambda spr: spr.splat_time or 0)
             for old in ground_splats[:-2]:
@@ -222,7 +701,7 @@ class GameWorld:
         other = self.player2 if owner is self.player1 else self.player1
         last_input = getattr(other, "last_input_at", 0)
         other_active = bool(last_input) and (
-            pygame.time.get_ticks() - last_input <= self._SELF_HIT_ACTIVITY_WINDOW_MS
+            self.clock.now() - last_input <= self._SELF_HIT_ACTIVITY_WINDOW_MS
         )
         if other_active:
             owner.missed_banana_streak = min(owner.missed_banana_streak + 1, 7)
@@ -231,4 +710,27 @@ class GameWorld:
         owner.missed_banana_streak = 0
         return False
 
+def _refill(group: IndexedGroup, sprites: list[pygame.sprite.Sprite]) -> None:
+    """Make ``group`` hold exactly ``sprites``, skipping the full re-index when membership is unchanged.
+
+    Restored sprites can still sit elsewhere than when they were indexed (the
+    projectile pool recycles bananas), so members whose rect moved are re-indexed.
+    """
+    if group.sprites() != sprites:
+        group.empty()
+        group.add(*sprites)
+        return
+    stale = group.index.stale
+    for sprite in sprites:
+        if stale(sprite):
+            group.reindex(sprite)
+
+
+def _player_index(players: Tuple[Hero, Hero], hero: Hero | None) -> int:
+    for idx, player in enumerate(players):
+        if player is hero:
+            return idx
+    return -1
+
+
 __all__ = ["GameWorld"]
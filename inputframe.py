@@ -0,0 +1,81 @@
+"""Per-tick player input snapshots built from the pygame event queue."""
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+import pygame
+
+from keymap import ACTION_BITS, actions_mask
+
+
+class InputFrame(NamedTuple):
+    """Both players' action bitmasks (see ``keymap.ACTIONS``) for one world tick."""
+
+    first: int = 0
+    second: int = 0
+
+
+IDLE_FRAME = InputFrame()
+
+
+class InputTracker:
+    """Folds KEYDOWN/KEYUP events into held action bits for both players.
+
+    Every event is handled as it arrives, so a tap that starts and ends between
+    two world ticks is latched and still reaches the next ``frame()``.
+    """
+
+    def __init__(self, players: Iterable) -> None:
+        self.players = tuple(players)
+        self._bindings: dict[int, list[tuple[int, int]]] = {}
+        self._held = [0, 0]
+        self._latched = [0, 0]
+        self.rebind()
+
+    def rebind(self) -> None:
+        """Rebuild the keycode lookup from the heroes' current controls."""
+        bindings: dict[int, list[tuple[int, int]]] = {}
+        for idx, hero in enumerate(self.players):
+            for action, keycode in hero.controls.items():
+                bit = ACTION_BITS.get(action)
+                if bit is not None and keycode is not None:
+                    bindings.setdefault(keycode, []).append((idx, bit))
+        self._bindings = bindings
+        self.sync()
+
+    def sync(self) -> None:
+        """Resynchronise held bits with the keyboard (after rebinding or regaining focus)."""
+        if not pygame.display.get_init():
+            self.clear()
+            return
+        pressed = pygame.key.get_pressed()
+        self._held = [actions_mask(pressed, hero.controls) for hero in self.players]
+        self._latched = [0, 0]
+
+    def clear(self) -> None:
+        self._held = [0, 0]
+        self._latched = [0, 0]
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            targets = self._bindings.get(event.key)
+            if targets:
+                for idx, bit in targets:
+                    self._held[idx] |= bit
+                    self._latched[idx] |= bit
+        elif event.type == pygame.KEYUP:
+            for idx, bit in self._bindings.get(event.key, ()):
+                self._held[idx] &= ~bit
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Key releases are not delivered while unfocused; drop everything held.
+            self.clear()
+
+    def frame(self) -> InputFrame:
+        """Return this tick's input and consume the latched presses."""
+        held, latched = self._held, self._latched
+        frame = InputFrame(held[0] | latched[0], held[1] | latched[1])
+        self._latched = [0, 0]
+        return frame
+
+
+__all__ = ["IDLE_FRAME", "InputFrame", "InputTracker"]
@@ -25,6 +25,10 @@ DEFAULT_KEY_NAMES = {
 }
 _KEYFILE = "keys.json"
 
+# Bit assigned to each action in a per-player input mask (stable: replays depend on it).
+ACTIONS = ("left", "right", "up", "down", "jump", "sling", "throw")
+ACTION_BITS = {action: 1 << idx for idx, action in enumerate(ACTIONS)}
+
 def _to_keycode(name: str) -> int:
     if not isinstance(name, str) or not name:
         raise ValueError("Empty key name")
@@ -88,6 +92,16 @@ def save_controls(player1: dict, player2: dict) -> None:
         pass
 
 
+def actions_mask(pressed, controls: dict) -> int:
+    """Pack the actions whose bound keys are held in ``pressed`` into a bitmask."""
+    mask = 0
+    for action, keycode in controls.items():
+        bit = ACTION_BITS.get(action)
+        if bit is not None and keycode is not None and pressed[keycode]:
+            mask |= bit
+    return mask
+
+
 def default_controls() -> tuple[dict, dict]:
     """Return freshly normalised copies of the shipped default bindings."""
     return (
@@ -1,11 +1,20 @@
 """Main entry point for SlingDuel."""
 from __future__ import annotations
 
+import argparse
+
 from game import Game
 
 
 def main() -> None:
-    Game().run()
+    parser = argparse.ArgumentParser(description="Play SlingDuel.")
+    parser.add_argument("--record", metavar="PATH", help="save each round's inputs as a replay file")
+    parser.add_argument(
+        "--checksums", action="store_true", help="also store a per-tick world checksum in recordings"
+    )
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded replay instead of reading keys")
+    args = parser.parse_args()
+    Game(record_path=args.record, record_checksums=args.checksums, replay_path=args.replay).run()
 
 
 if __name__ == "__main__":
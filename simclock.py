@@ -0,0 +1,45 @@
+"""Time sources for gameplay code: a tick-counting simulation clock and a wall-clock fallback."""
+from __future__ import annotations
+
+import pygame
+
+from constants import PHYSICS_HZ
+
+
+class SimClock:
+    """Counts simulation ticks and derives elapsed milliseconds from them.
+
+    Gameplay timers read ``now()`` instead of ``pygame.time.get_ticks()`` so
+    they advance exactly one tick per world update, regardless of how fast
+    (or whether) the world is being stepped in real time.
+    """
+
+    __slots__ = ("tick_ms", "ticks")
+
+    def __init__(self, tick_ms: float = 1000 / PHYSICS_HZ) -> None:
+        self.tick_ms = float(tick_ms)
+        self.ticks = 0
+
+    def now(self) -> int:
+        """Return elapsed simulation time in whole milliseconds."""
+        return int(self.ticks * self.tick_ms)
+
+    def advance(self, ticks: int = 1) -> None:
+        self.ticks += ticks
+
+    def reset(self) -> None:
+        self.ticks = 0
+
+
+class WallClock:
+    """Adapter exposing ``pygame.time.get_ticks`` through the SimClock interface."""
+
+    __slots__ = ()
+
+    def now(self) -> int:
+        return pygame.time.get_ticks()
+
+
+WALL_CLOCK = WallClock()
+
+__all__ = ["SimClock", "WallClock", "WALL_CLOCK"]
@@ -1,4 +1,6 @@
 """Banana projectile and pickup behaviours (flight, splat, and damage)."""
+from operator import attrgetter
+
 import pygame
 from .throwable import Throwable
 from constants import (
@@ -7,7 +9,29 @@ from constants import (
     PROJECTILE_GRAVITY,
     MAX_PROJECTILE_FALL_SPEED,
 )
-from assets import get_banana_image, get_banana_splashed
+from assets import get_banana_frames, get_banana_image, get_banana_splashed
+from simclock import WALL_CLOCK
+from .collision import line_crossing_toi
+from .spatial import surfaces_crossed
+
+# Mutable attributes captured by ``Banana.snapshot`` (rect and velocity follow them).
+_SNAPSHOT_FIELDS = (
+    "state", "frame_index", "damage_direct", "despawn_at_ms", "spawned_at_ms", "splat_time",
+    "_already_damaged_player", "_stepped_once", "_notified_result", "_prev_bottom",
+)
+_snapshot_values = attrgetter(*_SNAPSHOT_FIELDS)
+_SNAPSHOT_LEN = len(_SNAPSHOT_FIELDS)
+
+
+def banana_frames(base: pygame.Surface) -> tuple[pygame.Surface, ...]:
+    """The four quarter-turn rotations a flying banana cycles through."""
+    return (
+        base,
+        pygame.transform.rotate(base, 90),
+        pygame.transform.rotate(base, 180),
+        pygame.transform.rotate(base, 270),
+    )
+
 
 class BananaPickup(pygame.sprite.Sprite):
     """A stationary banana that sits until picked up."""
@@ -32,26 +56,39 @@ class Banana(Throwable):
 
     OWNER_IMMUNITY_MS = 150  # ignore collisions with owner for first few frames
 
-    def __init__(self, pos, velocity, image=None, owner=None, damage=1.0):
-        base = image if image is not None else get_banana_image()
-        super().__init__(pos, velocity, base, owner)
-
-        self.frames = [
-            base,
-            pygame.transform.rotate(base, 90),
-            pygame.transform.rotate(base, 180),
-            pygame.transform.rotate(base, 270),
-        ]
-        self.frame_index = 0.0
+    def __init__(self, pos, velocity, image=None, owner=None, damage=1.0, clock=None,
+                 *, frames=None, splat_image=None, stepped_image=None):
+        # ``frames`` and the splat images may be shared (see ``ProjectilePool``).
+        if frames is None:
+            frames = banana_frames(image) if image is not None else get_banana_frames()
+        super().__init__(pos, velocity, frames[0], owner)
+        self._clock = clock
+        self.frames = frames
         self.frame_speed = 0.3
+        if splat_image is None:
+            splat_image = get_banana_splashed()
+            stepped_image = get_banana_splashed(rotated=True)
+        elif stepped_image is None:
+            stepped_image = pygame.transform.rotate(splat_image, 90)
+        self.splat_image = splat_image
+        self.stepped_image = stepped_image  # splat after a step-on, a quarter turn round
+        self.damage_step = 0.5               # 0.5 when stepped on splat
+        self.level = None  # world queried for landing surfaces; falls back to the owner's
+        self.reset(pos, velocity, owner, damage)
 
-        self.splat_image = get_banana_splashed()
+    def reset(self, pos, velocity, owner=None, damage=1.0) -> None:
+        """Launch this banana from ``pos`` with ``velocity``."""
+        self.owner = owner
+        self.clock = self._clock or getattr(owner, "clock", None) or WALL_CLOCK
+        self.image = self.frames[0]
+        self.rect = self.image.get_rect(center=pos)
+        self.velocity.update(velocity)
+        self.frame_index = 0.0
 
         self.damage_direct = float(damage)   # 1.0 on direct hit
-        self.damage_step = 0.5               # 0.5 when stepped on splat
         self.state = "flying"
         self.despawn_at_ms: int | None = None
-        self.spawned_at_ms = pygame.time.get_ticks()
+        self.spawned_at_ms = self.clock.now()
         self.splat_time: int | None = None
 
         self._already_damaged_player = False
@@ -67,7 +104,7 @@ class Banana(Throwable):
         if self._already_damaged_player:
             return False
         if target is self.owner:
-            if pygame.time.get_ticks() - self.spawned_at_ms < self.OWNER_IMMUNITY_MS:
+            if self.clock.now() - self.spawned_at_ms < self.OWNER_IMMUNITY_MS:
                 return False
         return True
 
@@ -80,22 +117,35 @@ class Banana(Throwable):
     def _apply_gravity(self):
         self.velocity.y = min(self.velocity.y + PROJECTILE_GRAVITY, MAX_PROJECTILE_FALL_SPEED)
 
-    def _land_on_surface(self, platforms):
-        """Snap to ground or platform if intersecting from above; return True if landed."""
+    def _land_on_surface(self, platforms, dx: int = 0):
+        """Snap to ground or platform if intersecting from above; return True if landed.
+
+        ``dx`` is this tick's horizontal travel. Platforms are tested where the
+        banana was when its bottom crossed their stand line, so fast diagonal
+        throws cannot slip past a platform's end.
+        """
         # Ground check mirrors player collision to keep splats aligned with the floor.
         if self._prev_bottom <= GROUND_Y and self.rect.bottom >= GROUND_Y and self.velocity.y >= 0:
             self.rect.bottom = GROUND_Y
             return True
 
         # Platforms only catch bananas that fall from above; we ignore side hits.
-        if platforms:
-            for plat in platforms:
-                top = plat.stand_rect.top
-                if self._prev_bottom <= top and self.rect.bottom >= top and self.velocity.y >= 0:
-                    # Require horizontal overlap to avoid phantom catches.
-                    if self.rect.right >= plat.stand_rect.left and self.rect.left <= plat.stand_rect.right:
-                        self.rect.bottom = top
-                        return True
+        if platforms and self.velocity.y >= 0:
+            rect = self.rect
+            # Touching a stand rect's edge still counts, so widen the span by a pixel each side.
+            x_span = (min(rect.left, rect.left - dx) - 1, max(rect.right, rect.right - dx) + 1)
+            world = self.level if self.level is not None else getattr(self.owner, "world", None)
+            if world is not None:
+                candidates = world.surfaces_crossed(x_span, self._prev_bottom, rect.bottom)
+            else:
+                candidates = surfaces_crossed(platforms, x_span, self._prev_bottom, rect.bottom)
+            for plat in candidates:
+                stand = plat.stand_rect
+                toi = line_crossing_toi(self._prev_bottom, rect.bottom, stand.top)
+                left = rect.left - dx * (1.0 - toi)
+                if left - 1 < stand.right and left + rect.width + 1 > stand.left:
+                    rect.bottom = stand.top
+                    return True
         return False
 
     def _to_splat(self):
@@ -103,7 +153,7 @@ class Banana(Throwable):
         self.image = self.splat_image
         self.rect = self.image.get_rect(center=center)
         self.velocity.update(0, 0)
-        self.splat_time = pygame.time.get_ticks()
+        self.splat_time = self.clock.now()
 
     def on_hit(self, target):
         """Direct hit on a player: 1.0 dmg once, switch to splat image, fall to surface, then disappear after 0.5s."""
@@ -116,45 +166,57 @@ class Banana(Throwable):
         self.state = "falling_after_hit"
         self._notified_result = True
 
-    def update(self, platforms=None):
+    def fly(self, platforms=None) -> str | None:
+        """Move one tick in flight; return ``"landed"`` or ``"left"`` when the flight ends."""
         self._prev_bottom = self.rect.bottom
+        start_x = self.rect.centerx
+        self._apply_gravity()
+        self.rect.x += self.velocity.x
+        self.rect.y += self.velocity.y
+        self._animate_rotation()
 
-        if self.state == "flying":
-            self._apply_gravity()
-            self.rect.x += self.velocity.x
-            self.rect.y += self.velocity.y
-            self._animate_rotation()
+        if self._land_on_surface(platforms, self.rect.centerx - start_x):
+            return "landed"
+        if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
+            return "left"
+        return None
 
-            if self._land_on_surface(platforms):
-                self._to_splat()
-                self.state = "splatted_persist"
-                self._notify_owner_miss()
-                return
+    def update(self, platforms=None):
+        self._prev_bottom = self.rect.bottom
 
-            if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
-                self._to_splat()
-                self.state = "splatted_persist"
-                self._notify_owner_miss()
+        if self.state == "flying":
+            if self.fly(platforms) is not None:
+                self._persist_splat()
                 return
 
         elif self.state == "falling_after_hit":
+            start_x = self.rect.x
             self._apply_gravity()
             self.rect.x += self.velocity.x
             self.rect.y += self.velocity.y
-            if self._land_on_surface(platforms):
+            if self._land_on_surface(platforms, self.rect.x - start_x):
                 self.velocity.update(0, 0)
                 self.state = "splatted_temp"
-                self.despawn_at_ms = pygame.time.get_ticks() + 500  # 0.5s after landing
+                self.despawn_at_ms = self.clock.now() + 500  # 0.5s after landing
 
         elif self.state == "splatted_persist":
             # Wait for a player to step on the splat before starting the despawn timer.
             pass
 
         elif self.state == "splatted_temp":
-            now = pygame.time.get_ticks()
+            now = self.clock.now()
             if self.despawn_at_ms is not None and now >= self.despawn_at_ms:
                 self.kill()
 
+    def _persist_splat(self) -> None:
+        """Become a lasting splat and join the world's splat index until stepped on."""
+        self._to_splat()
+        self.state = "splatted_persist"
+        self._notify_owner_miss()
+        world = getattr(self.owner, "world", None)
+        if world is not None:
+            world.splats.add(self)
+
     def _notify_owner_miss(self) -> None:
         if self._notified_result:
             return
@@ -175,11 +237,31 @@ class Banana(Throwable):
         if hasattr(player, "start_slip_animation"):
             player.start_slip_animation()
         self.state = "splatted_temp"
-        self._rotate_splat_image(90)
-        self.despawn_at_ms = pygame.time.get_ticks() + 750  # 0.75s
-
-    def _rotate_splat_image(self, degrees: float) -> None:
+        world = getattr(self.owner, "world", None)
+        if world is not None:
+            world.splats.remove(self)
         center = self.rect.center
-        rotated = pygame.transform.rotate(self.image, degrees)
-        self.image = rotated
+        self.image = self.stepped_image
         self.rect = self.image.get_rect(center=center)
+        self.despawn_at_ms = self.clock.now() + 750  # 0.75s
+
+    def snapshot(self) -> tuple:
+        """Return all mutable state as a flat tuple of plain values (owner excluded)."""
+        rect = self.rect
+        return _snapshot_values(self) + (rect.x, rect.y, rect.w, rect.h, self.velocity.x, self.velocity.y)
+
+    def restore(self, snap) -> None:
+        self.__dict__.update(zip(_SNAPSHOT_FIELDS, snap))
+        x, y, w, h, vel_x, vel_y = snap[_SNAPSHOT_LEN:]
+        self.rect = pygame.Rect(x, y, w, h)
+        self.velocity.update(vel_x, vel_y)
+        self.restore_image()
+
+    def restore_image(self) -> None:
+        """Rebind ``image`` from the current state without moving the rect."""
+        if self.state == "flying":
+            self.image = self.frames[int(self.frame_index)]
+        elif self._stepped_once:
+            self.image = self.stepped_image
+        else:
+            self.image = self.splat_image
@@ -0,0 +1,81 @@
+"""Swept (continuous) collision tests for projectiles.
+
+Bananas and hooks move in whole-tick steps, so an overlap test at the end of
+a tick misses thin targets they passed through on the way. These helpers
+treat a tick's motion as a straight segment and return the earliest fraction
+of it, ``t`` in ``[0, 1]``, at which contact begins (``None`` for a miss).
+Overlap follows ``Rect.colliderect``: touching edges do not count.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import pygame
+
+_INF = float("inf")
+
+
+def _box_toi(x: float, y: float, dx: float, dy: float,
+             left: float, top: float, right: float, bottom: float) -> float | None:
+    """Earliest ``t`` in ``[0, 1]`` with ``(x + t*dx, y + t*dy)`` strictly inside the box."""
+    enter, leave = 0.0, 1.0
+    for pos, delta, low, high in ((x, dx, left, right), (y, dy, top, bottom)):
+        if delta == 0:
+            if not low < pos < high:
+                return None
+            continue
+        t_low = (low - pos) / delta
+        t_high = (high - pos) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        if t_low > enter:
+            enter = t_low
+        if t_high < leave:
+            leave = t_high
+        if enter >= leave:
+            return None
+    return enter
+
+
+def sweep_rect_toi(rect: pygame.Rect, delta: tuple[float, float], target: pygame.Rect) -> float | None:
+    """When ``rect``, moving by ``delta`` over the tick, first overlaps ``target``.
+
+    ``rect`` is the position at the start of the tick. The test sweeps its
+    top-left corner against ``target`` grown by ``rect``'s size.
+    """
+    return _box_toi(
+        rect.left, rect.top, delta[0], delta[1],
+        target.left - rect.width, target.top - rect.height, target.right, target.bottom,
+    )
+
+
+def first_impact(
+    rect: pygame.Rect, delta: tuple[float, float], targets: Sequence[pygame.Rect]
+) -> tuple[float, int] | None:
+    """Return ``(t, index)`` of the target ``rect`` meets first; ties go to the lower index."""
+    best: tuple[float, int] | None = None
+    best_t = _INF
+    # Cheap reject: only targets touching the swept bounds can be hit.
+    bounds = rect.union(rect.move(delta[0], delta[1])).inflate(2, 2)
+    for index, target in enumerate(targets):
+        if not bounds.colliderect(target):
+            continue
+        toi = sweep_rect_toi(rect, delta, target)
+        if toi is not None and toi < best_t:
+            best, best_t = (toi, index), toi
+    return best
+
+
+def line_crossing_toi(start: float, end: float, line: float) -> float | None:
+    """When a coordinate moving from ``start`` to ``end`` reaches ``line`` (both ends inclusive)."""
+    if start == end:
+        return 0.0 if start == line else None
+    t = (line - start) / (end - start)
+    return t if 0.0 <= t <= 1.0 else None
+
+
+__all__ = [
+    "first_impact",
+    "line_crossing_toi",
+    "sweep_rect_toi",
+]
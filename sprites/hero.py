@@ -1,5 +1,6 @@
 """Hero sprite logic: player movement, combat, and grappling hook control."""
 import math
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 import pygame
@@ -14,20 +15,66 @@ from constants import (
     HOOK_THROW_BASE_SPEED,
     HOOK_THROW_SPEED_MULTIPLIER,
 )
-from assets import get_hero_frames, get_banana_image
+from assets import get_hero_frames
+from keymap import ACTION_BITS
+from simclock import WALL_CLOCK
 from .banana import Banana
 from .sling import Sling
+from .spatial import surfaces_crossed
 
 if TYPE_CHECKING:
     from game.world import GameWorld
 
+_LEFT = ACTION_BITS["left"]
+_RIGHT = ACTION_BITS["right"]
+_UP = ACTION_BITS["up"]
+_DOWN = ACTION_BITS["down"]
+_JUMP = ACTION_BITS["jump"]
+_SLING = ACTION_BITS["sling"]
+_THROW = ACTION_BITS["throw"]
+
+# Mutable attributes captured by ``Hero.snapshot`` (rect, frame and throw vector follow them).
+_SNAPSHOT_FIELDS = (
+    "gravity", "speed", "facing_right", "health", "aim_angle", "on_platform",
+    "has_banana", "infinite_bananas", "_pending_throw", "_banana_refill_time", "_throw_prev",
+    "hook_ready_time", "hook_active", "_hook_prev", "_hook_momentum_x", "_hook_momentum_remainder",
+    "hero_run_index", "hero_jump_index", "hero_throw_index", "hero_fall_index", "is_throwing",
+    "is_slipping", "_slip_until", "_slip_start", "_slip_duration", "_slip_initial_velocity",
+    "missed_banana_streak", "has_landed_direct_banana_hit", "has_self_hit",
+    "last_input_at", "last_actions", "hit_stars_until", "hit_stars_start",
+)
+_snapshot_values = attrgetter(*_SNAPSHOT_FIELDS)
+_SNAPSHOT_LEN = len(_SNAPSHOT_FIELDS)
+
+# Animation frames by facing (True = right), then by name; built on first use and shared.
+_FRAME_SETS: dict[bool, dict[str, tuple[pygame.Surface, ...]]] = {}
+
+
+def hero_frame_sets() -> dict[bool, dict[str, tuple[pygame.Surface, ...]]]:
+    if not _FRAME_SETS:
+        for facing_right in (True, False):
+            stand, run, jump, throw, fall = get_hero_frames(flipped=not facing_right)
+            _FRAME_SETS[facing_right] = {
+                "stand": (stand,),
+                "run": tuple(run),
+                "jump": tuple(jump),
+                "throw": tuple(throw),
+                "fall": tuple(fall),
+            }
+    return _FRAME_SETS
+
+
 class Hero(pygame.sprite.Sprite):
     def __init__(self, controls: dict | None = None, start_x: int = 200,
                  name="Player", name_color=(255,255,255), *, facing_right: bool = True):
         super().__init__()
 
-        stand, self.hero_run, self.hero_jump, self.hero_throw, self.hero_fall = get_hero_frames()
-        self.hero_stand = stand
+        self._frame_sets = hero_frame_sets()
+        right = self._frame_sets[True]
+        self.hero_stand = right["stand"][0]
+        self.hero_run, self.hero_jump, self.hero_throw, self.hero_fall = (
+            right["run"], right["jump"], right["throw"], right["fall"]
+        )
 
         self.name = name
         self.name_color = name_color
@@ -53,11 +100,15 @@ class Hero(pygame.sprite.Sprite):
         self._slip_start = 0
         self._slip_duration = 0
         self.world: "GameWorld" | None = None
+        self.clock = WALL_CLOCK  # replaced by the owning world's SimClock
         self.last_input_at = 0
+        self.last_actions = 0  # action bitmask consumed on the most recent tick
         self.hit_stars_until = 0
         self.hit_stars_start = 0
 
         self.image = self.hero_stand
+        self.frame_key = ("stand", 0)
+        self._frame_facing_right = True
         self.rect = self.image.get_rect(midbottom=(start_x, GROUND_Y))
         self.gravity = 0
         self.speed = 0
@@ -105,11 +156,12 @@ class Hero(pygame.sprite.Sprite):
         self.on_platform = False
 
     # ------------------- input / movement / animation -------------------
-    def hero_input(self, hooks_group: pygame.sprite.Group | None):
-        keys = pygame.key.get_pressed()
-        now = pygame.time.get_ticks()
+    def hero_input(self, hooks_group: pygame.sprite.Group | None, actions: int = 0):
+        """Apply one tick of input given as an action bitmask (see ``keymap.ACTIONS``)."""
+        self.last_actions = actions
+        now = self.clock.now()
 
-        if any(keys[key] for key in self.controls.values() if key is not None):
+        if actions:
             self.last_input_at = now
 
         if self.infinite_bananas and not self.has_banana and now >= self._banana_refill_time:
@@ -121,15 +173,15 @@ class Hero(pygame.sprite.Sprite):
             return
 
         # Only allow the jump key to fire when feet are planted or on a platform.
-        jump_key = self.controls.get("jump")
-        if jump_key is not None and keys[jump_key] and (self.rect.bottom >= GROUND_Y or self.on_platform):
+        jump_pressed = bool(actions & _JUMP)
+        if jump_pressed and (self.rect.bottom >= GROUND_Y or self.on_platform):
             self.gravity = HERO_JUMP_FORCE
 
         # Acceleration is constant; left/right key overrides residual hook momentum.
-        if keys[self.controls["left"]]:
+        if actions & _LEFT:
             self.speed = -6
             self.facing_right = False
-        elif keys[self.controls["right"]]:
+        elif actions & _RIGHT:
             self.speed = 6
             self.facing_right = True
         else:
@@ -140,14 +192,13 @@ class Hero(pygame.sprite.Sprite):
             self._hook_momentum_remainder = 0.0
 
         # Adjust aim reticle with the same keys used for the menus (W/S or custom bindings).
-        if keys[self.controls["up"]]:
+        if actions & _UP:
             self.aim_angle = min(self.aim_max, self.aim_angle + self.aim_step)
-        elif keys[self.controls["down"]]:
+        elif actions & _DOWN:
             self.aim_angle = max(self.aim_min, self.aim_angle - self.aim_step)
 
         # Throw only if the hero is currently carrying a banana (or in infinite test mode).
-        throw_key = self.controls.get("throw")
-        throw_pressed = bool(throw_key is not None and keys[throw_key])
+        throw_pressed = bool(actions & _THROW)
         if (
             throw_pressed
             and not self._throw_prev
@@ -170,15 +221,17 @@ class Hero(pygame.sprite.Sprite):
 
         # Hook dispatch and rope control share logic between normal and test modes.
         if hooks_group is not None:
-            hook_pressed = keys[self.controls["sling"]]
-            jump_pressed = (jump_key is not None) and keys[jump_key]
+            hook_pressed = bool(actions & _SLING)
 
             # Single-shot on the frame the key becomes active.
             if hook_pressed and not self._hook_prev:
                 if (not self.hook_active) and (now >= self.hook_ready_time):
                     dir_vec = self._aim_direction()
                     velocity = dir_vec * (HOOK_THROW_BASE_SPEED * HOOK_THROW_SPEED_MULTIPLIER)  # hook starts faster than bananas
-                    self.hook_sprite = Sling(self.rect.center, velocity, owner=self)
+                    if self.world is not None:
+                        self.hook_sprite = self.world.projectile_pool.sling(self.rect.center, velocity, self)
+                    else:
+                        self.hook_sprite = Sling(self.rect.center, velocity, owner=self)
                     hooks_group.add(self.hook_sprite)
                     self._start_throw_animation()
                     self.hook_active = True
@@ -217,25 +270,25 @@ class Hero(pygame.sprite.Sprite):
 
         # Platform collision (falling from above only; bottom half is standable)
         if platforms and self.gravity >= 0:
-            hits = pygame.sprite.spritecollide(self, platforms, False)
-            for plat in hits:
-                top = plat.stand_rect.top
-                inner = self.banana_hitbox()
-                if inner.right <= plat.stand_rect.left or inner.left >= plat.stand_rect.right:
-                    continue
-                # from above: previous bottom was above the top stand line
-                if prev_bottom <= top and self.rect.bottom >= top:
-                    self.rect.bottom = top
-                    self.gravity = 0
-                    self.on_platform = True
-                    self._hook_momentum_x *= 0.6
-                    self._hook_momentum_remainder *= 0.6
+            inner = self.banana_hitbox()
+            x_span = (inner.left, inner.right)
+            # Land on the first stand line crossed since the previous tick.
+            if self.world is not None:
+                plat = self.world.first_surface_crossed(x_span, prev_bottom, self.rect.bottom)
+            else:
+                plat = next(iter(surfaces_crossed(platforms, x_span, prev_bottom, self.rect.bottom)), None)
+            if plat is not None:
+                self.rect.bottom = plat.stand_rect.top
+                self.gravity = 0
+                self.on_platform = True
+                self._hook_momentum_x *= 0.6
+                self._hook_momentum_remainder *= 0.6
 
     def move_horizontal(self):
         total = self.speed + self._hook_momentum_x + self._hook_momentum_remainder
         if self.is_slipping:
             duration = max(1, self._slip_duration)
-            elapsed = max(0, pygame.time.get_ticks() - self._slip_start)
+            elapsed = max(0, self.clock.now() - self._slip_start)
             progress = min(1.0, elapsed / duration)
             total = self._slip_initial_velocity * (1.0 - progress)
         dx = int(total)
@@ -262,11 +315,13 @@ class Hero(pygame.sprite.Sprite):
             self.rect.top = CEILING_Y
             if self.gravity < 0:
                 self.gravity = 0
+        if self.rect.bottom > GROUND_Y:
+            self.rect.bottom = GROUND_Y
 
     def animate(self):
-        frame = self.hero_stand
-        prev_midbottom = self.rect.midbottom
-        now = pygame.time.get_ticks()
+        frame_key = ("stand", 0)
+        prev_rect = self.rect
+        now = self.clock.now()
 
         if self.is_slipping and now >= self._slip_until:
             self.is_slipping = False
@@ -277,7 +332,7 @@ class Hero(pygame.sprite.Sprite):
                 self.hero_throw_index = 0.0
                 self.is_throwing = False
             else:
-                frame = self.hero_throw[int(self.hero_throw_index)]
+                frame_key = ("throw", int(self.hero_throw_index))
 
         if not self.is_throwing:
             if self.is_slipping:
@@ -287,20 +342,33 @@ class Hero(pygame.sprite.Sprite):
                     progress = min(0.999, elapsed / duration)
                     idx = min(len(self.hero_fall) - 1, int(progress * len(self.hero_fall)))
                     self.hero_fall_index = float(idx)
-                    frame = self.hero_fall[idx]
+                    frame_key = ("fall", idx)
             elif self.rect.bottom == GROUND_Y or self.on_platform:
                 if self.speed != 0:
                     self.hero_run_index = (self.hero_run_index + 0.4) % len(self.hero_run)
-                    frame = self.hero_run[int(self.hero_run_index)]
-                else:
-                    frame = self.hero_stand
+                    frame_key = ("run", int(self.hero_run_index))
             else:
                 self.hero_jump_index = (self.hero_jump_index + 0.1) % len(self.hero_jump)
-                frame = self.hero_jump[int(self.hero_jump_index)]
+                frame_key = ("jump", int(self.hero_jump_index))
+
+        # Left-facing frames are mirrored once up front, never per tick.
+        self.frame_key = frame_key
+        self._frame_facing_right = self.facing_right
+        self.image = self._frame_sets[self.facing_right][frame_key[0]][frame_key[1]]
+        if self.is_hanging:
+            # Keep the center the hook placed; frames differ in size.
+            self.rect = self.image.get_rect(center=prev_rect.center)
+        else:
+            self.rect = self.image.get_rect(midbottom=prev_rect.midbottom)
 
-        frame_to_use = frame if self.facing_right else pygame.transform.flip(frame, True, False)
-        self.image = frame_to_use
-        self.rect = self.image.get_rect(midbottom=prev_midbottom)
+    def restore_frame(self, frame_key: tuple[str, int]) -> None:
+        """Rebind ``image`` to the animation frame named by ``frame_key`` without moving the rect."""
+        name, idx = frame_key
+        if (name, idx) == self.frame_key and self._frame_facing_right == self.facing_right:
+            return
+        self.frame_key = (name, idx)
+        self._frame_facing_right = self.facing_right
+        self.image = self._frame_sets[self.facing_right][name][idx]
 
     # ------------------- helpers -------------------
     def get_aim_pos(self) -> tuple[int, int]:
@@ -344,7 +412,7 @@ class Hero(pygame.sprite.Sprite):
         self.is_slipping = True
         self.hero_fall_index = 0.0
         self._slip_duration = max(1, duration_ms)
-        self._slip_start = pygame.time.get_ticks()
+        self._slip_start = self.clock.now()
         self._slip_until = self._slip_start + self._slip_duration
         direction = 0.0
         if abs(self.speed) > 0.1:
@@ -375,7 +443,6 @@ class Hero(pygame.sprite.Sprite):
         self.on_platform = False
 
     def reset(self):
-        self.rect.bottom = GROUND_Y
         self.gravity = 0
         self.speed = 0
         self.hero_run_index = 0.0
@@ -383,6 +450,9 @@ class Hero(pygame.sprite.Sprite):
         self.hero_throw_index = 0.0
         self.is_throwing = False
         self.image = self.hero_stand
+        self.frame_key = ("stand", 0)
+        self._frame_facing_right = True
+        self.rect = self.image.get_rect(midbottom=(self.rect.centerx, GROUND_Y))
         self.facing_right = self._initial_facing_right
         self.aim_angle = 0.0
         self._pending_throw = False
@@ -394,6 +464,7 @@ class Hero(pygame.sprite.Sprite):
         self.has_landed_direct_banana_hit = False
         self.has_self_hit = False
         self.last_input_at = 0
+        self.last_actions = 0
         self.hit_stars_until = 0
         self.hit_stars_start = 0
         self.is_slipping = False
@@ -413,6 +484,22 @@ class Hero(pygame.sprite.Sprite):
         self._hook_momentum_x = 0.0
         self._hook_momentum_remainder = 0.0
 
+    def snapshot(self) -> tuple:
+        """Return all mutable state as a flat tuple of plain values (no surfaces)."""
+        rect = self.rect
+        throw = self._throw_velocity
+        return _snapshot_values(self) + (
+            rect.x, rect.y, rect.w, rect.h, self.frame_key[0], self.frame_key[1], throw.x, throw.y,
+        )
+
+    def restore(self, snap) -> None:
+        """Load a ``snapshot`` tuple; ``hook_sprite`` is relinked by the caller."""
+        self.__dict__.update(zip(_SNAPSHOT_FIELDS, snap))
+        x, y, w, h, frame_name, frame_idx, throw_x, throw_y = snap[_SNAPSHOT_LEN:]
+        self.restore_frame((frame_name, frame_idx))
+        self.rect = pygame.Rect(x, y, w, h)
+        self._throw_velocity = pygame.Vector2(throw_x, throw_y)
+
     def take_damage(self, amount: float = 1.0):
         self.health = max(0.0, self.health - amount)
 
@@ -427,6 +514,12 @@ class Hero(pygame.sprite.Sprite):
         self.has_landed_direct_banana_hit = True
         self.has_self_hit = True
 
+    @property
+    def is_hanging(self) -> bool:
+        """True while this hero's hook is attached and swinging or reeling them."""
+        hook = self.hook_sprite
+        return self.hook_active and hook is not None and hook.state == "attached"
+
     @property
     def is_dead(self) -> bool:
         return self.health <= 0.0
@@ -434,16 +527,22 @@ class Hero(pygame.sprite.Sprite):
     def update(self,
                projectiles: pygame.sprite.Group | None = None,
                hooks_group: pygame.sprite.Group | None = None,
-               platforms: pygame.sprite.Group | None = None):
-        self.hero_input(hooks_group)
-        self.apply_gravity(platforms)
-        self.move_horizontal()
+               platforms: pygame.sprite.Group | None = None,
+               actions: int = 0):
+        self.hero_input(hooks_group, actions)
+        # An attached hook is the only thing that moves a hanging hero.
+        if not self.is_hanging:
+            self.apply_gravity(platforms)
+            self.move_horizontal()
         self.animate()
 
         # spawn banana if requested
         if self._pending_throw and projectiles is not None:
-            banana_img = get_banana_image()
-            projectiles.add(Banana(self.rect.center, self._throw_velocity, banana_img, owner=self))
+            if self.world is not None:
+                banana = self.world.projectile_pool.banana(self.rect.center, self._throw_velocity, self)
+            else:
+                banana = Banana(self.rect.center, self._throw_velocity, owner=self)
+            projectiles.add(banana)
             self._pending_throw = False
 
         if self.hook_active:
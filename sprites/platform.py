@@ -3,9 +3,10 @@ import pygame
 
 class Platform(pygame.sprite.Sprite):
     """Static floating platform. Only the *bottom half* is standable."""
-    def __init__(self, image: pygame.Surface, midtop: tuple[int, int]):
+    def __init__(self, image: pygame.Surface, midtop: tuple[int, int], variant: int = 0):
         super().__init__()
         self.image = image
+        self.variant = variant  # index into assets.get_floor_images()
         self.rect = self.image.get_rect(midtop=midtop)
         # standable area = bottom half
         half_h = self.rect.height // 2
@@ -1,8 +1,29 @@
 """Grappling hook projectile that transitions between flight, attachment, and release."""
 import math
+from operator import attrgetter
+
 import pygame
 from constants import SCREEN_WIDTH, GROUND_Y, PROJECTILE_GRAVITY, MAX_PROJECTILE_FALL_SPEED
 from assets import get_hook_image
+from simclock import WALL_CLOCK
+from .collision import first_impact
+
+# Mutable attributes captured by ``Sling.snapshot`` (geometry and vectors follow them).
+_SNAPSHOT_FIELDS = (
+    "state", "attached_at_ms", "spawned_at_ms", "attach_enabled_at_ms", "travelled", "rope_len",
+    "theta", "omega", "pull_mode", "release_requested", "min_rope_len", "motion_mode",
+    "_swing_x", "_swing_y",
+)
+_snapshot_values = attrgetter(*_SNAPSHOT_FIELDS)
+_SNAPSHOT_LEN = len(_SNAPSHOT_FIELDS)
+
+SWING_REFERENCE_HZ = 60  # swing_gravity and swing_damping are per tick at this physics rate
+
+
+def hook_images() -> tuple[pygame.Surface, pygame.Surface]:
+    """The hook image facing right and its mirror for left-facing throws."""
+    return get_hook_image(), get_hook_image(flipped=True)
+
 
 class Sling(pygame.sprite.Sprite):
     """Grapple (hook).
@@ -19,6 +40,8 @@ class Sling(pygame.sprite.Sprite):
     pull_speed = 14          # straight-line pull strength while reeling
     reel_distance = 1.6      # rope shortens by this many px per tick when pulling
     swing_gravity = 0.45     # pseudo gravity used for swing mode
+    swing_damping = 0.985    # fraction of angular velocity kept per reference tick
+    swing_substeps = 4       # integration sub-steps per reference tick
     max_release_speed = 34   # clamp magnitude of release impulse
     snap_height_factor = 0.55  # fraction of hero height before snapping onto surface
     swing_release_boost = 2.3  # multiplier applied to swing release velocity
@@ -27,31 +50,33 @@ class Sling(pygame.sprite.Sprite):
     ATTACH_GRACE_MS = 90
     MIN_TRAVEL_BEFORE_ATTACH = 30
 
-    def __init__(self, pos, velocity, owner=None):
+    def __init__(self, pos, velocity, owner=None, clock=None, *, images=None):
         super().__init__()
+        # ``images`` may be shared (see ``hook_images`` and ``ProjectilePool``).
+        self._clock = clock
+        self._images = images
+        self.level = None  # world to search for attach points; the owner's unless set
+        self.flipped: bool | None = None
+        self.velocity = pygame.Vector2()
+        self.owner_velocity = pygame.Vector2()
+        self.reset(pos, velocity, owner)
+
+    def reset(self, pos, velocity, owner=None) -> None:
+        """Throw this hook from ``pos`` with ``velocity``."""
         self.owner = owner
-        base_image = get_hook_image()
-        base_rect = base_image.get_rect()
-        anchor_local = pygame.Vector2(base_rect.left, base_rect.bottom) - pygame.Vector2(base_rect.center)
-
-        self.velocity = pygame.Vector2(velocity)
+        self.clock = self._clock or getattr(owner, "clock", None) or WALL_CLOCK
+        self.velocity.update(velocity)
         should_flip = self.velocity.x < 0
         if self.velocity.x == 0 and owner is not None and not owner.facing_right:
             should_flip = True
-        if should_flip:
-            base_image = pygame.transform.flip(base_image, True, False)
-            anchor_local.x *= -1
-
-        self.image = base_image
+        if should_flip != self.flipped:
+            self.set_orientation(should_flip)
         self.rect = self.image.get_rect(center=pos)
 
-        r = self.image.get_rect()
-        self.rope_anchor_local = anchor_local
-
         self.state = "flying"     # lifecycle: flying → attached → done
         self.anchor = None
         self.attached_at_ms = None
-        self.spawned_at_ms = pygame.time.get_ticks()
+        self.spawned_at_ms = self.clock.now()
         self.attach_enabled_at_ms = self.spawned_at_ms + self.ATTACH_GRACE_MS
         self.travelled = 0.0
 
@@ -61,9 +86,12 @@ class Sling(pygame.sprite.Sprite):
         self.omega = 0.0            # angular velocity
         self.pull_mode = False      # set by hero when jump is held
         self.release_requested = False
-        self.owner_velocity = pygame.Vector2(0, 0)
+        self.owner_velocity.update(0, 0)
         self.min_rope_len = 16.0
         self.motion_mode = "swing"
+        # Unrounded owner center while swinging; the rect only holds a truncated copy.
+        self._swing_x: float | None = None
+        self._swing_y: float | None = None
 
     # ---- external controls from Hero ----
     def set_pull(self, on: bool):
@@ -72,7 +100,43 @@ class Sling(pygame.sprite.Sprite):
     def request_release(self):
         self.release_requested = True
 
+    # ---- snapshots ----
+    def snapshot(self) -> tuple:
+        """Return all mutable state as a flat tuple of plain values (owner excluded)."""
+        rect = self.rect
+        anchor = self.anchor
+        return _snapshot_values(self) + (
+            rect.x, rect.y, rect.w, rect.h,
+            self.velocity.x, self.velocity.y,
+            self.owner_velocity.x, self.owner_velocity.y,
+            anchor[0] if anchor is not None else None,
+            anchor[1] if anchor is not None else None,
+            self.flipped,
+        )
+
+    def restore(self, snap) -> None:
+        self.__dict__.update(zip(_SNAPSHOT_FIELDS, snap))
+        x, y, w, h, vel_x, vel_y, own_x, own_y, anchor_x, anchor_y, flipped = snap[_SNAPSHOT_LEN:]
+        if flipped != self.flipped:
+            self.set_orientation(flipped)
+        self.rect = pygame.Rect(x, y, w, h)
+        self.velocity.update(vel_x, vel_y)
+        self.owner_velocity.update(own_x, own_y)
+        self.anchor = (anchor_x, anchor_y) if anchor_x is not None else None
+
     # ---- helpers ----
+    def set_orientation(self, flipped: bool) -> None:
+        """Pick the hook image and rope anchor for a left- or right-facing throw."""
+        images = self._images if self._images is not None else hook_images()
+        base_image = images[1] if flipped else images[0]
+        base_rect = base_image.get_rect()
+        anchor_local = pygame.Vector2(base_rect.left, base_rect.bottom) - pygame.Vector2(base_rect.center)
+        if flipped:
+            anchor_local.x *= -1
+        self.flipped = bool(flipped)
+        self.image = base_image
+        self.rope_anchor_local = anchor_local
+
     def rope_world_anchor(self) -> tuple[int, int]:
         world_anchor = pygame.Vector2(self.rect.center) + self.rope_anchor_local
         return int(world_anchor.x), int(world_anchor.y)
@@ -84,7 +148,7 @@ class Sling(pygame.sprite.Sprite):
         self.state = "attached"
         self.anchor = self.rope_world_anchor()
         self.velocity.update(0, 0)
-        self.attached_at_ms = pygame.time.get_ticks()
+        self.attached_at_ms = self.clock.now()
 
         # On first attach, capture the rope length and orientation to seed pendulum motion.
         if self.owner:
@@ -111,14 +175,14 @@ class Sling(pygame.sprite.Sprite):
     def _can_detach(self) -> bool:
         if self.attached_at_ms is None:
             return False
-        return (pygame.time.get_ticks() - self.attached_at_ms) >= self.MIN_STICK_MS
+        return (self.clock.now() - self.attached_at_ms) >= self.MIN_STICK_MS
 
     def _detach(self):
         self.state = "done"
         self.kill()
 
     def update(self, platforms=None):
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
 
         if self.state == "flying":
             self._update_flying(now, platforms)
@@ -128,6 +192,16 @@ class Sling(pygame.sprite.Sprite):
             self.kill()
 
     def _update_flying(self, now: int, platforms: pygame.sprite.Group | None) -> None:
+        caught = self.fly(now, platforms)
+        if caught == "left":
+            # If the hook leaves the screen before hitting anything, remove it quietly.
+            self._detach()
+        elif caught is not None:
+            self.attach()
+
+    def fly(self, now: int, platforms: pygame.sprite.Group | None = None) -> str | None:
+        """Move one tick in flight; return ``"platform"``, ``"ceiling"``, ``"ground"`` or ``"left"`` when it ends."""
+        start = self.rect.copy()
         self._apply_gravity()
         self.rect.x += self.velocity.x
         self.rect.y += self.velocity.y
@@ -138,31 +212,52 @@ class Sling(pygame.sprite.Sprite):
             self.travelled >= self.MIN_TRAVEL_BEFORE_ATTACH
         )
 
+        # Platforms only allow attachment when the hook hits the standable top surface.
+        # Platforms sit between the ceiling and the ground, so they are met first.
+        if allow_attach and platforms and self._catch_platform(start, platforms):
+            return "platform"
+
         # Ceiling attachment mirrors how bananas collide with the level top cap.
         if allow_attach and self.rect.top <= 0:
             self.rect.top = 0
-            self.attach()
-            return
+            return "ceiling"
 
         # Ground checks use the same bottom alignment as banana landings.
         if allow_attach and self.rect.bottom >= GROUND_Y:
             self.rect.bottom = GROUND_Y
-            self.attach()
-            return
+            return "ground"
 
-        # Platforms only allow attachment when the hook hits the standable top surface.
-        if allow_attach and platforms:
-            hits = pygame.sprite.spritecollide(self, platforms, False)
-            for plat in hits:
-                overlap = self.rect.clip(plat.stand_rect)
-                if overlap.width > 0 and overlap.height > 0:
-                    self.rect.center = overlap.center
-                    self.attach()
-                    return
-
-        # If the hook leaves the screen before hitting anything, remove it quietly.
         if self.rect.right < 0 or self.rect.left > SCREEN_WIDTH:
-            self._detach()
+            return "left"
+        return None
+
+    def _catch_platform(self, start: pygame.Rect, platforms: pygame.sprite.Group) -> bool:
+        """Move onto the first stand rect swept this tick; return True if there was one."""
+        delta = (self.rect.x - start.x, self.rect.y - start.y)
+        swept = start.union(self.rect)
+        world = self.level if self.level is not None else getattr(self.owner, "world", None)
+        if world is not None:
+            candidates = world.surfaces_overlapping(swept)
+        else:
+            candidates = [plat for plat in platforms if swept.colliderect(plat.stand_rect)]
+        if not candidates:
+            return False
+        impact = first_impact(start, delta, [plat.stand_rect for plat in candidates])
+        if impact is None:
+            return False
+        toi, index = impact
+        stand = candidates[index].stand_rect
+        if self.rect.colliderect(stand):
+            self.rect.center = self.rect.clip(stand).center
+        else:
+            # Passed clean through within the tick: latch where contact began.
+            center_x = round(start.centerx + delta[0] * toi)
+            center_y = round(start.centery + delta[1] * toi)
+            self.rect.center = (
+                min(max(center_x, stand.left), stand.right - 1),
+                min(max(center_y, stand.top), stand.bottom - 1),
+            )
+        return True
 
     def _update_attached(self, now: int, platforms: pygame.sprite.Group | None) -> None:
         # Safety auto-detach adds an upper bound in case the owner never releases the key.
@@ -176,14 +271,20 @@ class Sling(pygame.sprite.Sprite):
 
         oc = pygame.Vector2(self.owner.rect.center)
         an = pygame.Vector2(self.anchor)
-        v = oc - an
-        if v.length_squared() == 0:
-            v = pygame.Vector2(0.001, 0.001)
 
-        # Recompute pendulum parameters from the owner's current location.
-        self.theta = math.atan2(v.x, v.y if v.y != 0 else 1)
+        swing_x, swing_y = self._swing_x, self._swing_y
+        self._swing_x = self._swing_y = None
+        if swing_x is not None and self.owner.rect.center == (int(swing_x), int(swing_y)):
+            # Nothing moved the owner since the last swing step: carry on from the float state.
+            prev_center = pygame.Vector2(swing_x, swing_y)
+        else:
+            v = oc - an
+            if v.length_squared() == 0:
+                v = pygame.Vector2(0.001, 0.001)
 
-        prev_center = pygame.Vector2(self.owner.rect.center)
+            # Recompute pendulum parameters from the owner's current location.
+            self.theta = math.atan2(v.x, v.y if v.y != 0 else 1)
+            prev_center = pygame.Vector2(oc)
 
         snapped = False
         target_center = None
@@ -224,10 +325,7 @@ class Sling(pygame.sprite.Sprite):
                 self._auto_detach_on_snap()
         else:
             # When not pulling, integrate a light pendulum swing with damping.
-            g = self.swing_gravity
-            self.omega += (g / self.rope_len) * math.sin(self.theta)
-            self.omega *= 0.985  # slightly less damping to keep momentum
-            self.theta -= self.omega
+            self._integrate_swing()
 
             # Clamp the owner to the rope circle so the swing never stretches the constraint.
             new_rel = pygame.Vector2(math.sin(self.theta), math.cos(self.theta)) * self.rope_len
@@ -241,6 +339,19 @@ class Sling(pygame.sprite.Sprite):
             self.owner.rect.centery = int(target_center.y)
             self.owner.clamp_vertical_bounds()
             center_vec = pygame.Vector2(self.owner.rect.center)
+            if self.motion_mode == "swing":
+                # Keep the exact position for the next tick; an axis the level bounds
+                # pushed back takes the bounded value, and the swing goes on from there.
+                swing_x, swing_y = target_center.x, target_center.y
+                if center_vec.x != int(swing_x):
+                    swing_x = center_vec.x
+                if center_vec.y != int(swing_y):
+                    swing_y = center_vec.y
+                if (swing_x, swing_y) != (target_center.x, target_center.y):
+                    v = pygame.Vector2(swing_x, swing_y) - an
+                    self.theta = math.atan2(v.x, v.y if v.y != 0 else 1)
+                center_vec = pygame.Vector2(swing_x, swing_y)
+                self._swing_x, self._swing_y = swing_x, swing_y
 
         new_center = pygame.Vector2(self.owner.rect.center)
         if not snapped:
@@ -262,6 +373,25 @@ class Sling(pygame.sprite.Sprite):
             self._detach()
 
     # ---- internal helpers ----
+    def _integrate_swing(self) -> None:
+        """Advance ``theta``/``omega`` by one tick with semi-implicit Euler sub-steps.
+
+        The step size is a fixed fraction of a reference tick, so the swing
+        follows the same path whatever the physics rate. At 60 Hz with one
+        sub-step this is the original per-tick update.
+        """
+        tick_ms = getattr(self.clock, "tick_ms", None)
+        ticks = tick_ms * SWING_REFERENCE_HZ / 1000 if tick_ms else 1.0
+        steps = max(1, round(self.swing_substeps * ticks))
+        dt = ticks / steps
+        pull = self.swing_gravity / self.rope_len * dt
+        damping = self.swing_damping ** dt
+        theta, omega = self.theta, self.omega
+        for _ in range(steps):
+            omega = (omega + pull * math.sin(theta)) * damping
+            theta -= omega * dt
+        self.theta, self.omega = theta, omega
+
     def _snap_owner_to_surface(self, anchor_vec: pygame.Vector2) -> pygame.Vector2 | None:
         if not self.owner:
             return None
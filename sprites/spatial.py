@@ -0,0 +1,220 @@
+"""Spatial indexes for static level geometry: a uniform-grid hash, a sprite
+group that keeps one in sync, and a sorted index of platform stand lines."""
+from __future__ import annotations
+
+import bisect
+from typing import Iterable
+
+import pygame
+
+CELL_SIZE = 128
+LINEAR_SCAN_LIMIT = 8  # IndexedGroup.near skips the grid for groups this small
+
+
+class SpatialHash:
+    """Maps fixed-size grid cells to the sprites whose rects overlap them.
+
+    Only the rect a sprite had when it was inserted is indexed; ``stale``
+    tells when it has moved since, and ``move`` re-indexes it.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[pygame.sprite.Sprite, None]] = {}
+        self._keys: dict[pygame.sprite.Sprite, tuple[tuple[int, int], ...]] = {}
+        self._rects: dict[pygame.sprite.Sprite, pygame.Rect] = {}
+
+    def _cells_for(self, rect: pygame.Rect) -> tuple[tuple[int, int], ...]:
+        size = self.cell_size
+        x0 = rect.left // size
+        x1 = max(rect.left, rect.right - 1) // size
+        y0 = rect.top // size
+        y1 = max(rect.top, rect.bottom - 1) // size
+        return tuple((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        keys = self._cells_for(sprite.rect)
+        self._keys[sprite] = keys
+        self._rects[sprite] = sprite.rect.copy()
+        cells = self._cells
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = {sprite: None}
+            else:
+                bucket[sprite] = None
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        keys = self._keys.pop(sprite, ())
+        self._rects.pop(sprite, None)
+        cells = self._cells
+        for key in keys:
+            bucket = cells[key]
+            del bucket[sprite]
+            if not bucket:
+                del cells[key]
+
+    def move(self, sprite: pygame.sprite.Sprite) -> None:
+        self.remove(sprite)
+        self.insert(sprite)
+
+    def stale(self, sprite: pygame.sprite.Sprite) -> bool:
+        """True if an indexed ``sprite``'s rect differs from the one it was indexed under."""
+        return sprite.rect != self._rects[sprite]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._keys.clear()
+        self._rects.clear()
+
+    def query(self, rect: pygame.Rect) -> set[pygame.sprite.Sprite]:
+        """Return every sprite sharing a cell with ``rect`` (a superset of true overlaps)."""
+        cells = self._cells
+        found: set[pygame.sprite.Sprite] = set()
+        for key in self._cells_for(rect):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """A ``pygame.sprite.Group`` whose members are also held in a ``SpatialHash``.
+
+    Meant for sprites that stay put while grouped (platforms, pickups,
+    splats). Queries return sprites in group order, so code switching from a
+    linear scan keeps the same, deterministic, first-match behaviour.
+    ``version`` changes whenever membership does, so derived indexes can
+    tell when to rebuild.
+    """
+
+    def __init__(self, *sprites: pygame.sprite.Sprite, cell_size: int = CELL_SIZE) -> None:
+        self.index = SpatialHash(cell_size)
+        self._order: dict[pygame.sprite.Sprite, int] = {}
+        self._next_order = 0
+        self.version = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._order[sprite] = self._next_order
+        self._next_order += 1
+        self.version += 1
+        self.index.insert(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self._order[sprite]
+        self.version += 1
+        self.index.remove(sprite)
+
+    def reindex(self, sprite: pygame.sprite.Sprite) -> None:
+        """Refresh the cells of a member whose rect has changed."""
+        self.index.move(sprite)
+
+    def near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Members that may overlap ``rect``, in group order."""
+        if len(self.spritedict) <= LINEAR_SCAN_LIMIT:
+            # A handful of members is cheaper to hand back whole than to look up in the grid.
+            return list(self.spritedict)
+        found = self.index.query(rect)
+        if len(found) > 1:
+            return sorted(found, key=self._order.__getitem__)
+        return list(found)
+
+    def near_any(self, rects: Iterable[pygame.Rect]) -> list[pygame.sprite.Sprite]:
+        """Members that may overlap any of ``rects``, each listed once, in group order."""
+        found: set[pygame.sprite.Sprite] = set()
+        for rect in rects:
+            found |= self.index.query(rect)
+        return sorted(found, key=self._order.__getitem__)
+
+    def colliding(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Members whose rect overlaps ``rect``, in group order (like ``spritecollide``)."""
+        return [sprite for sprite in self.near(rect) if rect.colliderect(sprite.rect)]
+
+
+class StandLineIndex:
+    """Platform stand lines (``stand_rect`` tops) sorted by y within x columns.
+
+    Built once per platform layout. ``crossed`` answers "which stand lines lie
+    between y0 and y1 under this horizontal span" by bisecting each covered
+    column instead of testing every platform.
+    """
+
+    def __init__(self, platforms: Iterable[pygame.sprite.Sprite] = (), column_width: int = CELL_SIZE) -> None:
+        self.column_width = column_width
+        self.max_depth = 0  # tallest stand_rect, for overlap queries
+        self._order: dict[pygame.sprite.Sprite, int] = {}
+        entries: dict[int, list[tuple[int, int, pygame.sprite.Sprite]]] = {}
+        for order, platform in enumerate(platforms):
+            stand = platform.stand_rect
+            self._order[platform] = order
+            self.max_depth = max(self.max_depth, stand.height)
+            for column in range(stand.left // column_width, max(stand.left, stand.right - 1) // column_width + 1):
+                entries.setdefault(column, []).append((stand.top, order, platform))
+        self._columns: dict[int, tuple[list[int], list[tuple[int, int, pygame.sprite.Sprite]]]] = {}
+        for column, lines in entries.items():
+            lines.sort(key=lambda line: (line[0], line[1]))
+            self._columns[column] = ([line[0] for line in lines], lines)
+
+    def crossed(self, x_span: tuple[int, int], y0: int, y1: int) -> list[pygame.sprite.Sprite]:
+        """Platforms whose stand top lies in ``[y0, y1]`` and whose stand rect overlaps ``x_span``.
+
+        ``x_span`` is ``(left, right)`` with Rect semantics (right exclusive).
+        Results are ordered by stand top, then by platform order.
+        """
+        left, right = x_span
+        if right <= left or y1 < y0:
+            return []
+        width = self.column_width
+        found: list[tuple[int, int, pygame.sprite.Sprite]] = []
+        seen: set[int] = set()
+        for column in range(left // width, (right - 1) // width + 1):
+            bucket = self._columns.get(column)
+            if bucket is None:
+                continue
+            tops, lines = bucket
+            for idx in range(bisect.bisect_left(tops, y0), bisect.bisect_right(tops, y1)):
+                line = lines[idx]
+                stand = line[2].stand_rect
+                if line[1] not in seen and left < stand.right and right > stand.left:
+                    seen.add(line[1])
+                    found.append(line)
+        if len(found) > 1:
+            found.sort(key=lambda line: (line[0], line[1]))
+        return [line[2] for line in found]
+
+    def overlapping(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Platforms whose stand rect overlaps ``rect``, in platform order."""
+        candidates = self.crossed((rect.left, rect.right), rect.top - self.max_depth + 1, rect.bottom - 1)
+        hits = [platform for platform in candidates if rect.colliderect(platform.stand_rect)]
+        if len(hits) > 1:
+            hits.sort(key=self._order.__getitem__)
+        return hits
+
+
+def surfaces_crossed(
+    platforms: Iterable[pygame.sprite.Sprite], x_span: tuple[int, int], y0: int, y1: int
+) -> list[pygame.sprite.Sprite]:
+    """Linear-scan version of ``StandLineIndex.crossed`` for sprites used outside a world."""
+    left, right = x_span
+    lines = [
+        (platform.stand_rect.top, order, platform)
+        for order, platform in enumerate(platforms)
+        if y0 <= platform.stand_rect.top <= y1
+        and left < platform.stand_rect.right
+        and right > platform.stand_rect.left
+    ]
+    lines.sort(key=lambda line: (line[0], line[1]))
+    return [line[2] for line in lines]
+
+
+__all__ = [
+    "CELL_SIZE",
+    "IndexedGroup",
+    "LINEAR_SCAN_LIMIT",
+    "SpatialHash",
+    "StandLineIndex",
+    "surfaces_crossed",
+]